@@ -0,0 +1,34 @@
+"""Add properties feed keyset index
+
+Revision ID: 043163ea4b1f
+Revises: add_avatar_url
+Create Date: 2026-10-18 09:12:41.518302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '043163ea4b1f'
+down_revision: Union[str, Sequence[str], None] = 'add_avatar_url'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_properties_active_created_at_id',
+        'properties',
+        ['created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_properties_active_created_at_id', table_name='properties')
@@ -0,0 +1,28 @@
+"""Add swipes property likes index
+
+Revision ID: 0f66138c1088
+Revises: e5ac7746417e
+Create Date: 2026-10-18 17:31:48.204177
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0f66138c1088'
+down_revision: Union[str, Sequence[str], None] = 'e5ac7746417e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_swipes_property_id_is_liked_created_at', 'swipes', ['property_id', 'is_liked', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_swipes_property_id_is_liked_created_at', table_name='swipes')
@@ -0,0 +1,52 @@
+"""Add property daily stats
+
+Revision ID: 24ca27b0c9a4
+Revises: 0f66138c1088
+Create Date: 2026-10-18 07:14:09.541604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '24ca27b0c9a4'
+down_revision: Union[str, Sequence[str], None] = '0f66138c1088'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('property_daily_stats',
+    sa.Column('property_id', sa.Uuid(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('likes', sa.Integer(), nullable=False),
+    sa.Column('passes', sa.Integer(), nullable=False),
+    sa.Column('matches', sa.Integer(), nullable=False),
+    sa.Column('rejections', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['property_id'], ['properties.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('property_id', 'day')
+    )
+    # Backfill from the existing swipes and matches
+    op.execute("""
+        INSERT INTO property_daily_stats (property_id, day, likes, passes, matches, rejections)
+        SELECT property_id, day, sum(likes), sum(passes), sum(matches), sum(rejections)
+        FROM (
+            SELECT property_id, created_at::date AS day,
+                   is_liked::int AS likes, (NOT is_liked)::int AS passes, 0 AS matches, 0 AS rejections
+            FROM swipes
+            UNION ALL
+            SELECT property_id, created_at::date,
+                   0, 0, (status = 'accepted')::int, (status = 'rejected')::int
+            FROM matches
+        ) events
+        GROUP BY property_id, day
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('property_daily_stats')
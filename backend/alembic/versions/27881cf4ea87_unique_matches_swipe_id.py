@@ -0,0 +1,64 @@
+"""Unique matches swipe_id
+
+Revision ID: 27881cf4ea87
+Revises: 24ca27b0c9a4
+Create Date: 2026-10-18 07:20:13.086561
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '27881cf4ea87'
+down_revision: Union[str, Sequence[str], None] = '24ca27b0c9a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# First match of each swipe, the one kept
+KEPT_MATCHES = """
+    SELECT DISTINCT ON (swipe_id) swipe_id, id
+    FROM matches
+    ORDER BY swipe_id, created_at, id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Move the messages of duplicate matches to the kept one
+    op.execute(f"""
+        WITH kept AS ({KEPT_MATCHES})
+        UPDATE messages msg
+        SET match_id = kept.id
+        FROM matches m
+        JOIN kept ON kept.swipe_id = m.swipe_id
+        WHERE msg.match_id = m.id AND m.id <> kept.id
+    """)
+    # Delete duplicate matches and uncount them from the daily stats
+    op.execute(f"""
+        WITH kept AS ({KEPT_MATCHES}),
+        deleted AS (
+            DELETE FROM matches m
+            USING kept
+            WHERE m.swipe_id = kept.swipe_id AND m.id <> kept.id
+            RETURNING m.property_id, m.created_at::date AS day, m.status
+        )
+        UPDATE property_daily_stats s
+        SET matches = s.matches - d.matches, rejections = s.rejections - d.rejections
+        FROM (
+            SELECT property_id, day,
+                   count(*) FILTER (WHERE status = 'accepted') AS matches,
+                   count(*) FILTER (WHERE status = 'rejected') AS rejections
+            FROM deleted
+            GROUP BY property_id, day
+        ) d
+        WHERE s.property_id = d.property_id AND s.day = d.day
+    """)
+    op.create_unique_constraint('uq_matches_swipe_id', 'matches', ['swipe_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_matches_swipe_id', 'matches', type_='unique')
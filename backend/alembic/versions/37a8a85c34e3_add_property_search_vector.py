@@ -0,0 +1,33 @@
+"""Add property search_vector
+
+Revision ID: 37a8a85c34e3
+Revises: 927cc157351c
+Create Date: 2026-10-18 12:40:09.117364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.models.property import PROPERTY_SEARCH_VECTOR_SQL
+
+
+# revision identifiers, used by Alembic.
+revision: str = '37a8a85c34e3'
+down_revision: Union[str, Sequence[str], None] = '927cc157351c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('properties', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(PROPERTY_SEARCH_VECTOR_SQL, persisted=True), nullable=True))
+    op.create_index('ix_properties_search_vector', 'properties', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_properties_search_vector', table_name='properties', postgresql_using='gin')
+    op.drop_column('properties', 'search_vector')
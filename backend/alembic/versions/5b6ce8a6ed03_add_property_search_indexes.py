@@ -0,0 +1,42 @@
+"""Add property search indexes
+
+Revision ID: 5b6ce8a6ed03
+Revises: 043163ea4b1f
+Create Date: 2026-10-18 10:03:17.204816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b6ce8a6ed03'
+down_revision: Union[str, Sequence[str], None] = '043163ea4b1f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_properties_active_city_created_at_id',
+        'properties',
+        ['city', 'created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+    op.create_index(
+        'ix_properties_active_city_price',
+        'properties',
+        ['city', 'price'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_properties_active_city_price', table_name='properties')
+    op.drop_index('ix_properties_active_city_created_at_id', table_name='properties')
@@ -0,0 +1,57 @@
+"""Unique swipes student/property
+
+Revision ID: 646b58a115bd
+Revises: 6f33eb50fc40
+Create Date: 2026-10-18 15:02:44.281903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '646b58a115bd'
+down_revision: Union[str, Sequence[str], None] = '6f33eb50fc40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Swipes of each student/property pair, the one to keep first
+RANKED_SWIPES = """
+    ranked AS (
+        SELECT s.id, first_value(s.id) OVER pair AS kept_id, row_number() OVER pair AS rank
+        FROM swipes s
+        WINDOW pair AS (
+            PARTITION BY s.student_id, s.property_id
+            ORDER BY EXISTS (SELECT 1 FROM matches m WHERE m.swipe_id = s.id) DESC, s.created_at, s.id
+        )
+    )
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # One swipe survives per student/property pair: the first one a match points to, or else
+    # the first one. Matches of the other swipes are moved to it, then those swipes deleted.
+    op.execute(f"""
+        WITH {RANKED_SWIPES}
+        UPDATE matches m
+        SET swipe_id = ranked.kept_id
+        FROM ranked
+        WHERE m.swipe_id = ranked.id AND ranked.rank > 1
+    """)
+    op.execute(f"""
+        WITH {RANKED_SWIPES}
+        DELETE FROM swipes s
+        USING ranked
+        WHERE s.id = ranked.id AND ranked.rank > 1
+    """)
+    op.drop_index('ix_swipes_student_id_property_id', table_name='swipes')
+    op.create_unique_constraint('uq_swipes_student_id_property_id', 'swipes', ['student_id', 'property_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_swipes_student_id_property_id', 'swipes', type_='unique')
+    op.create_index('ix_swipes_student_id_property_id', 'swipes', ['student_id', 'property_id'], unique=False)
@@ -0,0 +1,30 @@
+"""Add matches conversation indexes
+
+Revision ID: 69e1fd787d15
+Revises: 27881cf4ea87
+Create Date: 2026-10-18 07:23:36.686316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '69e1fd787d15'
+down_revision: Union[str, Sequence[str], None] = '27881cf4ea87'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_matches_student_id_status_last_message_at', 'matches', ['student_id', 'status', sa.text('last_message_at DESC NULLS LAST')], unique=False)
+    op.create_index('ix_matches_landlord_id_status_last_message_at', 'matches', ['landlord_id', 'status', sa.text('last_message_at DESC NULLS LAST')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_matches_landlord_id_status_last_message_at', table_name='matches')
+    op.drop_index('ix_matches_student_id_status_last_message_at', table_name='matches')
@@ -0,0 +1,28 @@
+"""Add swipes student/property index
+
+Revision ID: 6f33eb50fc40
+Revises: bb236ab946ee
+Create Date: 2026-10-18 14:31:05.392570
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f33eb50fc40'
+down_revision: Union[str, Sequence[str], None] = 'bb236ab946ee'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_swipes_student_id_property_id', 'swipes', ['student_id', 'property_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_swipes_student_id_property_id', table_name='swipes')
@@ -0,0 +1,38 @@
+"""Add property geo_cell
+
+Revision ID: 927cc157351c
+Revises: 5b6ce8a6ed03
+Create Date: 2026-10-18 11:26:52.841177
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.geo import GEO_CELL_SQL
+
+
+# revision identifiers, used by Alembic.
+revision: str = '927cc157351c'
+down_revision: Union[str, Sequence[str], None] = '5b6ce8a6ed03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('properties', sa.Column('geo_cell', sa.Integer(), sa.Computed(GEO_CELL_SQL, persisted=True), nullable=True))
+    op.create_index(
+        'ix_properties_active_geo_cell',
+        'properties',
+        ['geo_cell'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_properties_active_geo_cell', table_name='properties')
+    op.drop_column('properties', 'geo_cell')
@@ -0,0 +1,28 @@
+"""Add property_images property/position index
+
+Revision ID: a55ad2f8a224
+Revises: 646b58a115bd
+Create Date: 2026-10-18 16:20:37.918264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a55ad2f8a224'
+down_revision: Union[str, Sequence[str], None] = '646b58a115bd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_property_images_property_id_position', 'property_images', ['property_id', 'position'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_property_images_property_id_position', table_name='property_images')
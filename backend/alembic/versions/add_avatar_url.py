@@ -1,7 +1,7 @@
 """Add avatar_url to users
 
 Revision ID: add_avatar_url
-Revises: 
+Revises: 887566960987
 Create Date: 2026-02-16
 
 """
@@ -11,7 +11,7 @@ import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision = 'add_avatar_url'
-down_revision = None  # Update this to your latest migration
+down_revision = '887566960987'
 branch_labels = None
 depends_on = None
 
@@ -0,0 +1,42 @@
+"""Add property amenity_ids
+
+Revision ID: bb236ab946ee
+Revises: 37a8a85c34e3
+Create Date: 2026-10-18 13:52:30.664218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bb236ab946ee'
+down_revision: Union[str, Sequence[str], None] = '37a8a85c34e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('properties', sa.Column('amenity_ids', postgresql.ARRAY(sa.Uuid()), server_default='{}', nullable=False))
+    # Backfill from the link table
+    op.execute("""
+        UPDATE properties p
+        SET amenity_ids = pa.amenity_ids
+        FROM (
+            SELECT property_id, array_agg(amenity_id) AS amenity_ids
+            FROM property_amenities
+            GROUP BY property_id
+        ) pa
+        WHERE pa.property_id = p.id
+    """)
+    op.create_index('ix_properties_amenity_ids', 'properties', ['amenity_ids'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_properties_amenity_ids', table_name='properties', postgresql_using='gin')
+    op.drop_column('properties', 'amenity_ids')
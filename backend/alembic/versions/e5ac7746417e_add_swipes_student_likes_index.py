@@ -0,0 +1,28 @@
+"""Add swipes student likes index
+
+Revision ID: e5ac7746417e
+Revises: a55ad2f8a224
+Create Date: 2026-10-18 17:04:12.550913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5ac7746417e'
+down_revision: Union[str, Sequence[str], None] = 'a55ad2f8a224'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_swipes_student_id_is_liked_created_at', 'swipes', ['student_id', 'is_liked', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_swipes_student_id_is_liked_created_at', table_name='swipes')
@@ -1,11 +1,14 @@
 from typing import List, Optional
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from sqlalchemy import func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, desc
 from app.api.deps import get_async_session, current_active_user, current_superuser
-from app.models.property import Amenity
+from app.core.etag import etag_matches, make_etag, not_modified
+from app.models.property import Amenity, Property
 from app.models.user import User
+from app.services.property_cache import invalidate_property
 
 from app.schemas.property import AmenityRead, AmenityCreate
 
@@ -13,13 +16,23 @@ router = APIRouter()
 
 @router.get("/", response_model=List[AmenityRead])
 async def list_amenities(
+    response: Response,
     session: AsyncSession = Depends(get_async_session),
     skip: int = 0,
     limit: int = 100,
+    if_none_match: Optional[str] = Header(None),
 ):
-    query = select(Amenity).offset(skip).limit(limit)
+    """Returns 304 when `If-None-Match` holds the current ETag."""
+    query = select(Amenity).order_by(Amenity.name, Amenity.id).offset(skip).limit(limit)
     result = await session.execute(query)
-    return result.scalars().all()
+    amenities = result.scalars().all()
+    
+    # Amenities have no timestamps: version the page by its content
+    etag = make_etag(*((a.id, a.name, a.category, a.icon) for a in amenities))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return amenities
 
 @router.post("/", response_model=AmenityRead)
 async def create_amenity(
@@ -43,5 +56,18 @@ async def delete_amenity(
     if not amenity:
         raise HTTPException(status_code=404, detail="Amenity not found")
     await session.delete(amenity)
+    # Keep the denormalized amenity_ids in sync with the deleted links. The UPDATE also
+    # bumps updated_at, and so the ETags of the listings.
+    result = await session.execute(
+        update(Property)
+        .where(Property.amenity_ids.contains([amenity_id]))
+        .values(amenity_ids=func.array_remove(Property.amenity_ids, amenity_id))
+        .returning(Property.id)
+        .execution_options(synchronize_session=False)
+    )
+    property_ids = result.scalars().all()
     await session.commit()
+    
+    for property_id in property_ids:
+        invalidate_property(property_id)
     return {"message": "Amenity deleted"}
@@ -1,20 +1,82 @@
-from typing import List, Optional
+from collections import Counter
+from typing import List, Literal, Optional, Union
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
+from asyncpg.exceptions import ForeignKeyViolationError
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy import or_, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, desc
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import get_async_session, current_active_user
+from app.core.config import settings
+from app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
 from app.models.user import User
 from app.models.interaction import Swipe, Match, Notification
+from app.models.profile import LandlordProfile, StudentProfile
 from app.models.property import Property
 from app.schemas import interaction as schemas
+from app.schemas.property import PropertyCompactRead, PropertyRead
+from app.services.analytics import record_event, record_stats, stats_day, swipe_field
+from app.services.property_search import SUMMARY_COLUMNS, deck_query, first_image_url
+from app.services.scoring import SCORING_COLUMNS, CandidateColumns, rank_candidates
+
+# Foreign key rejecting swipes on unknown properties (Postgres' default name)
+SWIPES_PROPERTY_FK = "swipes_property_id_fkey"
 
 router = APIRouter()
 
+def is_unknown_property(error: IntegrityError) -> bool:
+    """Whether a swipe insert failed because its property does not exist."""
+    # The DBAPI error wraps the asyncpg one
+    cause = getattr(error.orig, "__cause__", None)
+    return isinstance(cause, ForeignKeyViolationError) and cause.constraint_name == SWIPES_PROPERTY_FK
+
 # --- Student Actions ---
 
+@router.get("/deck", response_model=List[PropertyRead])
+async def get_swipe_deck(
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+    limit: int = Query(20, ge=1, le=100),
+):
+    """
+    Next properties for the student to swipe, best fit first.
+    Only active properties not swiped yet, in the student's city when set, ranked on
+    budget, room type, furnished and guarantor income fit.
+    The ranking is an approximation over a recency window: only the newest
+    `DECK_CANDIDATE_POOL` candidates (setting) are scored, so a better fit among older
+    listings is not picked until the newer ones have been swiped.
+    """
+    if user.role != "student":
+        raise HTTPException(status_code=403, detail="Only students can swipe")
+    
+    profile = await session.get(StudentProfile, user.id)
+    if not profile:
+        query = deck_query(user.id, limit=limit).options(
+            selectinload(Property.amenities),
+            selectinload(Property.images)
+        )
+        result = await session.execute(query)
+        return result.scalars().all()
+    
+    # Score the newest candidates (recency window) column-wise, then load the winners only
+    pool = deck_query(user.id, profile, limit=settings.DECK_CANDIDATE_POOL).with_only_columns(*SCORING_COLUMNS)
+    rows = (await session.execute(pool)).all()
+    ranked_ids = rank_candidates(profile, CandidateColumns.from_rows(rows), limit)
+    if not ranked_ids:
+        return []
+    
+    query = select(Property).where(Property.id.in_(ranked_ids)).options(
+        selectinload(Property.amenities),
+        selectinload(Property.images)
+    )
+    result = await session.execute(query)
+    properties = {prop.id: prop for prop in result.scalars().all()}
+    return [properties[property_id] for property_id in ranked_ids]
+
 @router.post("/swipe", response_model=schemas.SwipeRead)
 async def create_swipe(
     swipe_in: schemas.SwipeCreate,
@@ -29,30 +91,98 @@ async def create_swipe(
     if user.role != "student":
         raise HTTPException(status_code=403, detail="Only students can swipe")
 
-    # Check if property exists
-    prop = await session.get(Property, swipe_in.property_id)
-    if not prop:
-        raise HTTPException(status_code=404, detail="Property not found")
-
-    # Check if already swiped
-    query = select(Swipe).where(
-        Swipe.student_id == user.id,
-        Swipe.property_id == swipe_in.property_id
-    )
-    existing = await session.execute(query)
-    if existing.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail="Already swiped on this property")
-
     swipe = Swipe(
         student_id=user.id,
         property_id=swipe_in.property_id,
         is_liked=swipe_in.is_liked
     )
-    session.add(swipe)
+    # Single round trip: the unique (student_id, property_id) constraint rejects duplicates,
+    # even when two requests race, and the property foreign key rejects unknown properties
+    stmt = (
+        insert(Swipe)
+        .values(**swipe.model_dump())
+        .on_conflict_do_nothing(constraint="uq_swipes_student_id_property_id")
+        .returning(Swipe.id)
+    )
+    try:
+        result = await session.execute(stmt)
+    except IntegrityError as e:
+        await session.rollback()
+        if not is_unknown_property(e):
+            raise
+        raise HTTPException(status_code=404, detail="Property not found")
+    if result.scalar_one_or_none() is None:
+        await session.rollback()
+        raise HTTPException(status_code=400, detail="Already swiped on this property")
+
+    await record_event(session, swipe.property_id, swipe_field(swipe.is_liked), swipe.created_at)
     await session.commit()
-    await session.refresh(swipe)
     return swipe
 
+@router.post("/swipes:batch", response_model=List[schemas.SwipeBatchResult])
+async def create_swipes_batch(
+    batch_in: schemas.SwipeBatchCreate,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Record swipes buffered by the client in one request.
+    Returns one result per swipe, in request order: `created`, `duplicate` (already swiped,
+    or repeated in the batch) or `not_found` (unknown property).
+    """
+    if user.role != "student":
+        raise HTTPException(status_code=403, detail="Only students can swipe")
+
+    property_ids = {swipe_in.property_id for swipe_in in batch_in.swipes}
+    result = await session.execute(select(Property.id).where(Property.id.in_(property_ids)))
+    existing_ids = set(result.scalars().all())
+
+    # First swipe of each existing property, the rest of the batch is reported as duplicates
+    swipes = {}
+    for swipe_in in batch_in.swipes:
+        if swipe_in.property_id in existing_ids and swipe_in.property_id not in swipes:
+            swipes[swipe_in.property_id] = Swipe(
+                student_id=user.id,
+                property_id=swipe_in.property_id,
+                is_liked=swipe_in.is_liked
+            )
+
+    created = {}
+    if swipes:
+        stmt = (
+            insert(Swipe)
+            .values([swipe.model_dump() for swipe in swipes.values()])
+            .on_conflict_do_nothing(constraint="uq_swipes_student_id_property_id")
+            .returning(Swipe.id, Swipe.property_id)
+        )
+        try:
+            result = await session.execute(stmt)
+        except IntegrityError as e:
+            await session.rollback()
+            if not is_unknown_property(e):
+                raise
+            # A property was deleted since the existence check
+            raise HTTPException(status_code=404, detail="Property not found")
+        created = {property_id: swipe_id for swipe_id, property_id in result.all()}
+        changes = {}
+        for property_id in created:
+            swipe = swipes[property_id]
+            changes.setdefault((property_id, stats_day(swipe.created_at)), Counter())[swipe_field(swipe.is_liked)] += 1
+        await record_stats(session, changes)
+        await session.commit()
+
+    results = []
+    for swipe_in in batch_in.swipes:
+        property_id = swipe_in.property_id
+        if property_id not in existing_ids:
+            results.append(schemas.SwipeBatchResult(property_id=property_id, status="not_found"))
+        elif property_id in created:
+            # Only the first occurrence in the batch is the created swipe
+            results.append(schemas.SwipeBatchResult(property_id=property_id, status="created", id=created.pop(property_id)))
+        else:
+            results.append(schemas.SwipeBatchResult(property_id=property_id, status="duplicate"))
+    return results
+
 @router.delete("/swipe/{property_id}")
 async def delete_swipe(
     property_id: uuid.UUID,
@@ -78,40 +208,83 @@ async def delete_swipe(
          raise HTTPException(status_code=400, detail="Cannot remove like because a match already exists.")
          
     await session.delete(swipe)
+    # Uncount it on the day it was counted
+    await record_event(session, swipe.property_id, swipe_field(swipe.is_liked), swipe.created_at, delta=-1)
     await session.commit()
     return {"message": "Swipe removed"}
     
-@router.get("/my-likes", response_model=List[schemas.SwipeRead])
+@router.get("/my-likes", response_model=List[schemas.SwipeWithPropertySummary])
 async def get_my_likes(
+    response: Response,
     user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ):
-    """List properties the student liked."""
+    """
+    List properties the student liked, most recent like first, with a summary of each property.
+    When a page is full, the `X-Next-Cursor` header holds a cursor to pass back
+    as `cursor` for the next page (keyset pagination, replaces `skip`).
+    """
     if user.role != "student":
         raise HTTPException(status_code=403, detail="Only students have likes")
     
-    query = select(Swipe).where(Swipe.student_id == user.id, Swipe.is_liked == True)
-    query = query.offset(skip).limit(limit)
-    result = await session.execute(query)
-    return result.scalars().all()
+    query = (
+        select(Swipe, *SUMMARY_COLUMNS)
+        .join(Property, Property.id == Swipe.property_id)
+        .where(Swipe.student_id == user.id, Swipe.is_liked == True)
+        .order_by(desc(Swipe.created_at), desc(Swipe.id))
+    )
+    if cursor:
+        query = query.where(tuple_(Swipe.created_at, Swipe.id) < decode_cursor(cursor))
+    else:
+        query = query.offset(skip)
+    result = await session.execute(query.limit(limit))
+    rows = result.all()
+    
+    if rows and len(rows) == limit:
+        last = rows[-1].Swipe
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+    return [
+        schemas.SwipeWithPropertySummary(
+            id=row.Swipe.id,
+            student_id=row.Swipe.student_id,
+            property_id=row.Swipe.property_id,
+            is_liked=row.Swipe.is_liked,
+            created_at=row.Swipe.created_at,
+            property=PropertyCompactRead.model_validate(row)
+        )
+        for row in rows
+    ]
 
 # --- Landlord Actions ---
 
-@router.get("/landlord/received-likes", response_model=List[schemas.SwipeWithStudent])
+@router.get(
+    "/landlord/received-likes",
+    response_model=Union[List[schemas.SwipeWithStudent], schemas.ReceivedLikesPage],
+)
 async def get_received_likes(
+    response: Response,
     user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
+    view: Literal["full", "normalized"] = "full",
+    property_id: Optional[uuid.UUID] = None,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ):
-    """See students who liked their properties."""
+    """
+    See students who liked their properties, most recent like first.
+    `view=normalized` returns each property summary once, in `properties`, and the likes
+    as compact rows referencing it (instead of a full property per like).
+    When a page is full, the `X-Next-Cursor` header holds a cursor to pass back
+    as `cursor` for the next page (keyset pagination, replaces `skip`).
+    """
     if user.role != "landlord":
         raise HTTPException(status_code=403, detail="Only landlords can view received likes")
 
     # Join Swipes with Properties where Property.landlord_id == user.id
-    # Also fetch the Property details
     query = (
         select(Swipe)
         .join(Property)
@@ -119,21 +292,57 @@ async def get_received_likes(
             Property.landlord_id == user.id,
             Swipe.is_liked == True
         )
-        .options(
+        .order_by(desc(Swipe.created_at), desc(Swipe.id))
+    )
+    if property_id:
+        query = query.where(Swipe.property_id == property_id)
+    
+    # Add pagination
+    if cursor:
+        query = query.where(tuple_(Swipe.created_at, Swipe.id) < decode_cursor(cursor))
+    else:
+        query = query.offset(skip)
+    query = query.limit(limit)
+    
+    if view == "normalized":
+        query = query.options(selectinload(Swipe.student).selectinload(User.student_profile))
+    else:
+        # Also fetch the Property details
+        query = query.options(
             selectinload(Swipe.property).selectinload(Property.amenities),
             selectinload(Swipe.property).selectinload(Property.images),
             selectinload(Swipe.student).selectinload(User.student_profile)
         )
-    )
-    
-    # Add pagination
-    query = query.offset(skip).limit(limit)
     
     result = await session.execute(query)
     swipes = result.scalars().all()
     
+    if swipes and len(swipes) == limit:
+        last = swipes[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+    
+    if view == "normalized":
+        property_ids = {swipe.property_id for swipe in swipes}
+        properties = {}
+        if property_ids:
+            result = await session.execute(select(*SUMMARY_COLUMNS).where(Property.id.in_(property_ids)))
+            properties = {row.id: PropertyCompactRead.model_validate(row) for row in result.all()}
+        return schemas.ReceivedLikesPage(
+            properties=properties,
+            likes=[
+                schemas.ReceivedLike(
+                    id=swipe.id,
+                    student_id=swipe.student_id,
+                    property_id=swipe.property_id,
+                    created_at=swipe.created_at,
+                    student=swipe.student.student_profile if swipe.student else None
+                )
+                for swipe in swipes
+            ]
+        )
+    
     # Manually construct response to map User -> StudentProfile
-    response = []
+    items = []
     for swipe in swipes:
         student_profile = swipe.student.student_profile if swipe.student else None
         
@@ -145,9 +354,48 @@ async def get_received_likes(
             property=swipe.property,
             student=student_profile
         )
-        response.append(item)
+        items.append(item)
 
-    return response
+    return items
+
+async def decide_swipe(session: AsyncSession, swipe: Swipe, landlord_id: uuid.UUID, status: str) -> Optional[Match]:
+    """
+    Create the match recording the landlord's decision on a like, with the student's
+    notification and the stats. Does not commit.
+    Returns None, without writing anything, when the like was already decided: the unique
+    swipe_id constraint makes double clicks and concurrent requests no-ops.
+    """
+    match = Match(
+        swipe_id=swipe.id,
+        student_id=swipe.student_id,
+        property_id=swipe.property_id,
+        landlord_id=landlord_id,
+        status=status
+    )
+    stmt = (
+        insert(Match)
+        .values(**match.model_dump())
+        .on_conflict_do_nothing(constraint="uq_matches_swipe_id")
+        .returning(Match.id)
+    )
+    result = await session.execute(stmt)
+    if result.scalar_one_or_none() is None:
+        return None
+
+    # Create Notification for Student
+    notif = Notification(
+        user_id=swipe.student_id,
+        type="match_created" if status == "accepted" else "match_rejected",
+        reference_id=match.id,
+        is_read=False
+    )
+    session.add(notif)
+    await record_event(session, swipe.property_id, "matches" if status == "accepted" else "rejections")
+    return match
+
+async def get_decision(session: AsyncSession, swipe_id: uuid.UUID) -> Match:
+    result = await session.execute(select(Match).where(Match.swipe_id == swipe_id))
+    return result.scalar_one()
 
 @router.post("/landlord/accept-swipe/{swipe_id}", response_model=schemas.MatchRead)
 async def accept_swipe(
@@ -155,7 +403,10 @@ async def accept_swipe(
     user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
 ):
-    """Landlord accepts a student's like -> Creates a Match"""
+    """
+    Landlord accepts a student's like -> Creates a Match.
+    Accepting again returns the same match.
+    """
     if user.role != "landlord":
         raise HTTPException(status_code=403, detail="Only landlords can accept swipes")
 
@@ -171,33 +422,14 @@ async def accept_swipe(
     if swipe.property.landlord_id != user.id:
         raise HTTPException(status_code=403, detail="Not your property")
 
-    # Check if match already exists
-    stmt_match = select(Match).where(Match.swipe_id == swipe.id)
-    existing_match = await session.execute(stmt_match)
-    if existing_match.scalar_one_or_none():
-         raise HTTPException(status_code=400, detail="Match already exists")
-
-    # Create Match
-    match = Match(
-        swipe_id=swipe.id,
-        student_id=swipe.student_id,
-        property_id=swipe.property_id,
-        landlord_id=user.id,
-        status="accepted"
-    )
-    session.add(match)
-    
-    # Create Notification for Student
-    notif = Notification(
-        user_id=swipe.student_id,
-        type="match_created",
-        reference_id=match.id,
-        is_read=False
-    )
-    session.add(notif)
+    match = await decide_swipe(session, swipe, user.id, "accepted")
+    if match is None:
+        match = await get_decision(session, swipe.id)
+        if match.status != "accepted":
+            raise HTTPException(status_code=400, detail="Swipe already rejected")
+        return match
 
     await session.commit()
-    await session.refresh(match)
     return match
 
 @router.post("/landlord/reject-swipe/{swipe_id}")
@@ -206,7 +438,7 @@ async def reject_swipe(
     user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
 ):
-    """Landlord rejects a like."""
+    """Landlord rejects a like. Rejecting again is a no-op."""
     if user.role != "landlord":
         raise HTTPException(status_code=403, detail="Only landlords can reject swipes")
 
@@ -217,27 +449,95 @@ async def reject_swipe(
     if not swipe or swipe.property.landlord_id != user.id:
         raise HTTPException(status_code=404, detail="Swipe not found or access denied")
     
-    match = Match(
-        swipe_id=swipe.id,
-        student_id=swipe.student_id,
-        property_id=swipe.property_id,
-        landlord_id=user.id,
-        status="rejected"
-    )
-    session.add(match)
-    
-    # Create Notification for Student
-    notif = Notification(
-        user_id=swipe.student_id,
-        type="match_rejected",
-        reference_id=match.id,
-        is_read=False
-    )
-    session.add(notif)
+    match = await decide_swipe(session, swipe, user.id, "rejected")
+    if match is None:
+        if (await get_decision(session, swipe.id)).status != "rejected":
+            raise HTTPException(status_code=400, detail="Swipe already accepted")
+        return {"message": "Swipe rejected"}
     
     await session.commit()
     return {"message": "Swipe rejected"}
 
+@router.post("/landlord/decisions:batch", response_model=List[schemas.SwipeDecisionResult])
+async def decide_swipes_batch(
+    batch_in: schemas.SwipeDecisionBatch,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Accept or reject many received likes in one request (one transaction).
+    Returns one result per decision, in request order: `accepted`, `rejected`,
+    `already_decided` (a match exists, or the swipe is repeated in the batch) or
+    `not_found` (unknown swipe, or a like on another landlord's property).
+    """
+    if user.role != "landlord":
+        raise HTTPException(status_code=403, detail="Only landlords can accept or reject swipes")
+
+    # Ownership and existing matches, in one query
+    swipe_ids = {decision.swipe_id for decision in batch_in.decisions}
+    query = (
+        select(Swipe.id, Swipe.student_id, Swipe.property_id, Match.id.label("match_id"))
+        .join(Property, Property.id == Swipe.property_id)
+        .outerjoin(Match, Match.swipe_id == Swipe.id)
+        .where(Swipe.id.in_(swipe_ids), Property.landlord_id == user.id, Swipe.is_liked == True)
+    )
+    result = await session.execute(query)
+    swipes = {row.id: row for row in result.all()}
+
+    # First decision on each undecided like, the rest of the batch is reported as already decided
+    matches = {}
+    for decision in batch_in.decisions:
+        swipe = swipes.get(decision.swipe_id)
+        if swipe is not None and swipe.match_id is None and swipe.id not in matches:
+            matches[swipe.id] = Match(
+                swipe_id=swipe.id,
+                student_id=swipe.student_id,
+                property_id=swipe.property_id,
+                landlord_id=user.id,
+                status="accepted" if decision.decision == "accept" else "rejected"
+            )
+
+    created = {}
+    if matches:
+        # Likes decided by a concurrent request meanwhile are skipped
+        stmt = (
+            insert(Match)
+            .values([match.model_dump() for match in matches.values()])
+            .on_conflict_do_nothing(constraint="uq_matches_swipe_id")
+            .returning(Match.swipe_id)
+        )
+        result = await session.execute(stmt)
+        created = {swipe_id: matches[swipe_id] for swipe_id in result.scalars().all()}
+
+    if created:
+        day = stats_day()
+        notifications, changes = [], {}
+        for match in created.values():
+            accepted = match.status == "accepted"
+            notifications.append(Notification(
+                user_id=match.student_id,
+                type="match_created" if accepted else "match_rejected",
+                reference_id=match.id,
+                is_read=False
+            ).model_dump())
+            changes.setdefault((match.property_id, day), Counter())["matches" if accepted else "rejections"] += 1
+        await session.execute(insert(Notification).values(notifications))
+        await record_stats(session, changes)
+        await session.commit()
+
+    results = []
+    for decision in batch_in.decisions:
+        swipe_id = decision.swipe_id
+        if swipe_id not in swipes:
+            results.append(schemas.SwipeDecisionResult(swipe_id=swipe_id, status="not_found"))
+        elif swipe_id in created:
+            # Only the first decision in the batch is the one applied
+            match = created.pop(swipe_id)
+            results.append(schemas.SwipeDecisionResult(swipe_id=swipe_id, status=match.status, match_id=match.id))
+        else:
+            results.append(schemas.SwipeDecisionResult(swipe_id=swipe_id, status="already_decided"))
+    return results
+
 # --- Common Actions ---
 
 @router.get("/matches", response_model=List[schemas.MatchRead])
@@ -258,3 +558,67 @@ async def get_my_matches(
     
     result = await session.execute(query)
     return result.scalars().all()
+
+@router.get("/conversations", response_model=List[schemas.Conversation])
+async def get_my_conversations(
+    response: Response,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+):
+    """
+    Inbox of the current user (Student or Landlord): accepted matches, most recent message
+    first, then matches without messages, with the property and the other participant.
+    When a page is full, the `X-Next-Cursor` header holds a cursor to pass back
+    as `cursor` for the next page (keyset pagination, replaces `skip`).
+    """
+    if user.role == "student":
+        own_id, counterpart_id, unread_count = Match.student_id, Match.landlord_id, Match.unread_count_student
+        counterpart_profile = LandlordProfile
+        counterpart_name = LandlordProfile.company_name
+    else:
+        own_id, counterpart_id, unread_count = Match.landlord_id, Match.student_id, Match.unread_count_landlord
+        counterpart_profile = StudentProfile
+        counterpart_name = StudentProfile.first_name + " " + StudentProfile.last_name
+
+    # One query: the property and the counterpart's user and profile are joined in
+    query = (
+        select(
+            Match.id,
+            Match.property_id,
+            Property.title.label("property_title"),
+            first_image_url.label("property_image_url"),
+            counterpart_id.label("counterpart_id"),
+            counterpart_name.label("counterpart_name"),
+            User.avatar_url.label("counterpart_avatar_url"),
+            Match.last_message_at,
+            Match.last_message_content,
+            unread_count.label("unread_count"),
+            Match.created_at,
+        )
+        .join(Property, Property.id == Match.property_id)
+        .join(User, User.id == counterpart_id)
+        .outerjoin(counterpart_profile, counterpart_profile.user_id == counterpart_id)
+        .where(own_id == user.id, Match.status == "accepted")
+        .order_by(Match.last_message_at.desc().nulls_last(), desc(Match.id))
+    )
+    if cursor:
+        last_message_at, match_id = decode_cursor(cursor)
+        if last_message_at is None:
+            query = query.where(Match.last_message_at.is_(None), Match.id < match_id)
+        else:
+            query = query.where(or_(
+                tuple_(Match.last_message_at, Match.id) < (last_message_at, match_id),
+                Match.last_message_at.is_(None),
+            ))
+    else:
+        query = query.offset(skip)
+    result = await session.execute(query.limit(limit))
+    rows = result.all()
+
+    if rows and len(rows) == limit:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.last_message_at, last.id)
+    return [schemas.Conversation.model_validate(row) for row in rows]
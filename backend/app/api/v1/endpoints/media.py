@@ -1,5 +1,6 @@
 from typing import List
 import uuid
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
@@ -9,6 +10,7 @@ from app.models.user import User
 from app.models.property import Property, PropertyImage
 from app.schemas import property as schemas
 from app.services.media import upload_image
+from app.services.property_cache import invalidate_property
 
 router = APIRouter()
 
@@ -43,8 +45,11 @@ async def add_property_image(
         position=position
     )
     session.add(img)
+    # Images are part of the listing: bump its version (ETag)
+    prop.updated_at = datetime.utcnow()
     await session.commit()
     await session.refresh(img)
+    invalidate_property(property_id)
     return img
 
 @router.delete("/images/{image_id}")
@@ -69,7 +74,9 @@ async def delete_property_image(
     # TODO: Optionally delete from Cloudinary too if using public_id extraction
     
     await session.delete(img)
+    prop.updated_at = datetime.utcnow()
     await session.commit()
+    invalidate_property(img.property_id)
     return {"message": "Image deleted"}
 
 @router.post("/avatar")
@@ -1,64 +1,307 @@
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import List, Literal, Optional, Tuple, Union
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, File, Header, HTTPException, status, Query, Response, UploadFile
+from pydantic import TypeAdapter
+from sqlalchemy import Uuid, and_, any_, bindparam, func, insert, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, desc, delete
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.api.deps import get_async_session, current_active_user
+from app.core.db import run_in_session
+from app.core.etag import etag_matches, make_etag, not_modified
+from app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
 from app.models.user import User
+from app.models.analytics import PropertyDailyStats
 from app.models.property import Property, PropertyAmenity, Amenity, PropertyImage
 from app.schemas import property as schemas
+from app.services.property_cache import (
+    cache_property_payload,
+    facet_cache,
+    facet_flight,
+    feed_flight,
+    invalidate_property,
+    property_cache,
+    property_etag,
+    property_flight,
+    property_generation,
+)
+from app.services.analytics import STAT_FIELDS, stats_day
+from app.services.property_import import detect_format, import_properties
+from app.services.property_search import (
+    COMPACT_COLUMNS,
+    PRICE_BUCKET_SIZE,
+    SearchFilters,
+    facet_query,
+    feed_query,
+)
 
 router = APIRouter()
 
-@router.get("/", response_model=List[schemas.PropertyRead])
+property_list_adapter = TypeAdapter(List[schemas.PropertyRead])
+compact_list_adapter = TypeAdapter(List[schemas.PropertyCompactRead])
+
+# Properties fetched per `ids` request
+MAX_BATCH_IDS = 200
+
+def search_filters(
+    q: Optional[str] = Query(None, max_length=200),
+    city: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    amenities: Optional[List[uuid.UUID]] = Query(None),
+    lat: Optional[float] = Query(None, ge=-90, le=90),
+    lng: Optional[float] = Query(None, ge=-180, le=180),
+    radius_km: Optional[float] = Query(None, gt=0, le=100),
+    min_lat: Optional[float] = Query(None, ge=-90, le=90),
+    max_lat: Optional[float] = Query(None, ge=-90, le=90),
+    min_lng: Optional[float] = Query(None, ge=-180, le=180),
+    max_lng: Optional[float] = Query(None, ge=-180, le=180),
+) -> SearchFilters:
+    """Search filters of the public listing endpoints."""
+    near = None
+    center = (lat, lng, radius_km)
+    if any(v is not None for v in center):
+        if any(v is None for v in center):
+            raise HTTPException(status_code=400, detail="lat, lng and radius_km must be provided together")
+        near = center
+    
+    bbox = None
+    box = (min_lat, max_lat, min_lng, max_lng)
+    if any(v is not None for v in box):
+        if any(v is None for v in box):
+            raise HTTPException(status_code=400, detail="min_lat, max_lat, min_lng and max_lng must be provided together")
+        bbox = box
+    
+    return SearchFilters(
+        city=city,
+        min_price=min_price,
+        max_price=max_price,
+        bbox=bbox,
+        text_query=q,
+        amenity_ids=tuple(dict.fromkeys(amenities or ())),
+        near=near,
+    )
+
+@router.get("/", response_model=Union[List[schemas.PropertyRead], List[schemas.PropertyCompactRead]])
 async def list_properties(
     session: AsyncSession = Depends(get_async_session),
+    filters: SearchFilters = Depends(search_filters),
+    view: Literal["full", "compact"] = "full",
     skip: int = 0,
     limit: int = 100,
-    city: Optional[str] = None,
-    min_price: Optional[float] = None,
-    max_price: Optional[float] = None,
+    cursor: Optional[str] = None,
+    ids: Optional[List[uuid.UUID]] = Query(None),
 ):
-    """List active properties with optional filters."""
-    query = select(Property).options(selectinload(Property.amenities), selectinload(Property.images))
-    
-    if city:
-        query = query.where(Property.city == city)
-    if min_price:
-        query = query.where(Property.price >= min_price)
-    if max_price:
-        query = query.where(Property.price <= max_price)
+    """
+    List active properties with optional filters, newest first.
+    When a page is full, the `X-Next-Cursor` header holds a cursor to pass back
+    as `cursor` for the next page (keyset pagination, replaces `skip`).
+    With `lat`, `lng` and `radius_km`, only properties within the radius are listed,
+    closest first (paginate with `skip`). `min_lat`/`max_lat`/`min_lng`/`max_lng`
+    restrict the results to a bounding box (e.g. the visible map area); a box crossing
+    the antimeridian has `min_lng` > `max_lng`.
+    `q` is a keyword search over title, description, city and address; results are
+    ranked by relevance (paginate with `skip`) unless sorted by distance.
+    `amenities` (repeatable) only keeps listings offering all the given amenities.
+    `view=compact` returns PropertyCompactRead summaries (map and grid views) instead
+    of full listings.
+    `ids` (repeatable, up to 200) fetches those properties instead, in the requested
+    order, whether active or not; unknown ids are skipped and the filters are ignored.
+    """
+    if ids is not None:
+        if len(ids) > MAX_BATCH_IDS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_IDS} ids per request")
+        payload = await fetch_properties_by_ids(session, list(dict.fromkeys(ids)), view)
+        return Response(content=payload, media_type="application/json")
+    
+    if cursor and filters.near:
+        raise HTTPException(status_code=400, detail="Cursor pagination is not available when sorting by distance")
+    if cursor and filters.text_query:
+        raise HTTPException(status_code=400, detail="Cursor pagination is not available for keyword searches")
+    
+    after = decode_cursor(cursor) if cursor else None
+    
+    async def fetch_feed(session: AsyncSession):
+        query = feed_query(filters, after=after, skip=skip, limit=limit)
+        if view == "compact":
+            # One query: the summary columns and the first image, no eager loads
+            result = await session.execute(query.with_only_columns(*COMPACT_COLUMNS))
+            properties = result.all()
+            adapter = compact_list_adapter
+        else:
+            query = query.options(selectinload(Property.amenities), selectinload(Property.images))
+            result = await session.execute(query)
+            properties = result.scalars().all()
+            adapter = property_list_adapter
         
-    query = query.where(Property.is_active == True)
-    query = query.order_by(desc(Property.created_at)).offset(skip).limit(limit)
+        next_cursor = None
+        if properties and len(properties) == limit and not (filters.near or filters.text_query):
+            last = properties[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return adapter.dump_json(adapter.validate_python(properties)), next_cursor
     
-    result = await session.execute(query)
-    return result.scalars().all()
+    # Identical concurrent searches share one query, in its own session
+    key = (filters, view, skip, limit, cursor)
+    payload, next_cursor = await feed_flight.do(key, lambda: run_in_session(fetch_feed))
+    
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+@router.get("/facets", response_model=schemas.PropertyFacets)
+async def get_property_facets(
+    filters: SearchFilters = Depends(search_filters),
+):
+    """
+    Number of active properties matching the `list_properties` filters, in total and
+    per city, room type, furnished and price bucket.
+    """
+    payload = facet_cache.get(filters)
+    if payload is None:
+        payload = await facet_flight.do(filters, lambda: run_in_session(fetch_facets_payload, filters))
+    return Response(content=payload, media_type="application/json")
+
+async def fetch_facets_payload(session: AsyncSession, filters: SearchFilters) -> bytes:
+    """Count the facets in one grouped query and cache the serialized result."""
+    result = await session.execute(facet_query(filters))
+    facets = schemas.PropertyFacets()
+    for city, room_type, furnished, price_bucket, count in result.all():
+        if city is not None:
+            facets.city[city] = count
+        elif room_type is not None:
+            facets.room_type[room_type] = count
+        elif furnished is not None:
+            facets.furnished[furnished] = count
+        elif price_bucket is not None:
+            facets.price.append(schemas.PriceBucketCount(
+                min_price=price_bucket,
+                max_price=price_bucket + PRICE_BUCKET_SIZE,
+                count=count
+            ))
+        else:
+            facets.total = count
+    facets.price.sort(key=lambda bucket: bucket.min_price)
+    
+    payload = facets.model_dump_json().encode()
+    facet_cache.set(filters, payload)
+    return payload
 
 @router.get("/me", response_model=List[schemas.PropertyRead])
 async def list_my_properties(
+    response: Response,
     user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
+    if_none_match: Optional[str] = Header(None),
 ):
-    """Landlord: List own properties."""
+    """
+    Landlord: List own properties.
+    Returns 304 when `If-None-Match` holds the current ETag (the list did not change).
+    """
     if user.role != "landlord":
         raise HTTPException(status_code=403, detail="Not a landlord")
+    
+    # Any created, deleted or updated listing changes the count or the latest updated_at
+    version = select(func.count(), func.max(Property.updated_at)).where(Property.landlord_id == user.id)
+    count, last_updated_at = (await session.execute(version)).one()
+    etag = make_etag(user.id, count, last_updated_at.isoformat() if last_updated_at else None)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
         
     query = select(Property).where(Property.landlord_id == user.id).options(
         selectinload(Property.amenities), 
         selectinload(Property.images)
     )
     result = await session.execute(query)
+    response.headers["ETag"] = etag
     return result.scalars().all()
 
+@router.get("/me/stats", response_model=List[schemas.PropertyStats])
+async def get_my_property_stats(
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+):
+    """
+    Landlord: likes, passes, matches and rejections of each own listing, per day and in total,
+    from `from` to `to` (inclusive, UTC days; defaults to the last 30 days).
+    Read from the daily rollup maintained by the swipe endpoints, in one query.
+    """
+    if user.role != "landlord":
+        raise HTTPException(status_code=403, detail="Not a landlord")
+
+    date_to = date_to or stats_day()
+    date_from = date_from or date_to - timedelta(days=29)
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+    if (date_to - date_from).days >= schemas.MAX_STATS_DAYS:
+        raise HTTPException(status_code=400, detail=f"At most {schemas.MAX_STATS_DAYS} days per request")
+
+    # Outer join: listings without activity are listed with zero counts
+    query = (
+        select(Property.id, Property.title, PropertyDailyStats)
+        .outerjoin(
+            PropertyDailyStats,
+            and_(
+                PropertyDailyStats.property_id == Property.id,
+                PropertyDailyStats.day >= date_from,
+                PropertyDailyStats.day <= date_to,
+            ),
+        )
+        .where(Property.landlord_id == user.id)
+        .order_by(desc(Property.created_at), Property.id, PropertyDailyStats.day)
+    )
+    result = await session.execute(query)
+
+    stats = {}
+    for property_id, title, day_stats in result.all():
+        item = stats.get(property_id)
+        if item is None:
+            item = stats[property_id] = schemas.PropertyStats(property_id=property_id, title=title)
+        if day_stats is None:
+            continue
+        item.days.append(schemas.PropertyDayStats.model_validate(day_stats, from_attributes=True))
+        for field in STAT_FIELDS:
+            setattr(item, field, getattr(item, field) + getattr(day_stats, field))
+    for item in stats.values():
+        item.match_rate = item.matches / item.likes if item.likes > 0 else None
+    return list(stats.values())
+
 @router.get("/{property_id}", response_model=schemas.PropertyRead)
 async def get_property(
     property_id: uuid.UUID,
     session: AsyncSession = Depends(get_async_session),
+    if_none_match: Optional[str] = Header(None),
 ):
-    """Get a single property by ID."""
+    """
+    Get a single property by ID.
+    Returns 304 when `If-None-Match` holds the current ETag.
+    """
+    cached = property_cache.get(property_id)
+    if cached is None and if_none_match:
+        # Revalidate against updated_at alone before loading the whole listing
+        result = await session.execute(select(Property.updated_at).where(Property.id == property_id))
+        updated_at = result.scalar_one_or_none()
+        if updated_at:
+            etag = property_etag(property_id, updated_at)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+    if cached is None:
+        # Concurrent misses on the same listing share one fetch, in its own session
+        cached = await property_flight.do(property_id, lambda: run_in_session(fetch_property_payload, property_id))
+    
+    etag, payload = cached
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return Response(content=payload, media_type="application/json", headers={"ETag": etag})
+
+async def fetch_property_payload(session: AsyncSession, property_id: uuid.UUID) -> Tuple[str, bytes]:
+    """Load a property and cache its ETag and serialized PropertyRead."""
+    # Taken before the read: a write committed meanwhile keeps the result out of the cache
+    generation = property_generation(property_id)
     query = select(Property).where(Property.id == property_id).options(
         selectinload(Property.amenities), 
         selectinload(Property.images)
@@ -69,7 +312,46 @@ async def get_property(
     if not prop:
         raise HTTPException(status_code=404, detail="Property not found")
     
-    return prop
+    return cache_property(prop, generation)
+
+def cache_property(prop: Property, generation: int) -> Tuple[str, bytes]:
+    """
+    Serialize a loaded property (with amenities and images) into the detail cache.
+    `generation` is the property's generation taken before it was loaded.
+    """
+    cached = (
+        property_etag(prop.id, prop.updated_at),
+        schemas.PropertyRead.model_validate(prop).model_dump_json().encode(),
+    )
+    cache_property_payload(prop.id, generation, cached)
+    return cached
+
+async def fetch_properties_by_ids(session: AsyncSession, ids: List[uuid.UUID], view: str) -> bytes:
+    """Serialized JSON list of the given properties, in `ids` order."""
+    if view == "compact":
+        result = await session.execute(select(*COMPACT_COLUMNS).where(Property.id.in_(ids)))
+        rows = {row.id: row for row in result.all()}
+        found = [rows[property_id] for property_id in ids if property_id in rows]
+        return compact_list_adapter.dump_json(compact_list_adapter.validate_python(found))
+    
+    # Reuse the detail cache, and load the misses in one query (plus the two eager loads)
+    payloads = {}
+    for property_id in ids:
+        cached = property_cache.get(property_id)
+        if cached is not None:
+            payloads[property_id] = cached[1]
+    missing = [property_id for property_id in ids if property_id not in payloads]
+    if missing:
+        generations = {property_id: property_generation(property_id) for property_id in missing}
+        query = select(Property).where(Property.id.in_(missing)).options(
+            selectinload(Property.amenities),
+            selectinload(Property.images)
+        )
+        result = await session.execute(query)
+        for prop in result.scalars().all():
+            payloads[prop.id] = cache_property(prop, generations[prop.id])[1]
+    
+    return b"[" + b",".join(payloads[property_id] for property_id in ids if property_id in payloads) + b"]"
 
 @router.post("/", response_model=schemas.PropertyRead)
 async def create_property(
@@ -81,36 +363,95 @@ async def create_property(
     if user.role != "landlord" and not user.is_superuser:
         raise HTTPException(status_code=403, detail="Only landlords can post properties")
     
-    amenity_ids = property_in.amenity_ids or []
+    amenity_ids = list(dict.fromkeys(property_in.amenity_ids or []))
     image_urls = property_in.image_urls or []
     
+    amenities = []
+    if amenity_ids:
+        result = await session.execute(select(Amenity).where(Amenity.id.in_(amenity_ids)))
+        amenities_by_id = {amenity.id: amenity for amenity in result.scalars().all()}
+        if len(amenities_by_id) != len(amenity_ids):
+            raise HTTPException(status_code=400, detail="Unknown amenity")
+        amenities = [amenities_by_id[amenity_id] for amenity_id in amenity_ids]
+    
     property_data = property_in.model_dump(exclude={"amenity_ids", "image_urls"})
-    property_obj = Property(**property_data, landlord_id=user.id)
+    property_obj = Property(**property_data, landlord_id=user.id, amenity_ids=amenity_ids)
+    images = [
+        PropertyImage(property_id=property_obj.id, image_url=url, position=idx)
+        for idx, url in enumerate(image_urls)
+    ]
     
+    # One transaction: the property row, then its links and images as multi-row inserts
     session.add(property_obj)
+    await session.flush()
+    if amenity_ids:
+        await session.execute(
+            insert(PropertyAmenity),
+            [{"property_id": property_obj.id, "amenity_id": amenity_id} for amenity_id in amenity_ids]
+        )
+    if images:
+        session.add_all(images)
     await session.commit()
-    await session.refresh(property_obj)
     
-    if amenity_ids:
-        for amenity_id in amenity_ids:
-            prop_amenity = PropertyAmenity(property_id=property_obj.id, amenity_id=amenity_id)
-            session.add(prop_amenity)
+    # Everything is already in memory, no need to reload the listing
+    set_committed_value(property_obj, "amenities", amenities)
+    set_committed_value(property_obj, "images", images)
+    return property_obj
+
+@router.post("/import", response_model=schemas.PropertyImportReport)
+async def import_properties_file(
+    file: UploadFile = File(...),
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Bulk-create listings from a CSV or NDJSON file (landlords only).
+    Valid rows are created in batches, invalid or unreadable ones are skipped and
+    reported by line. If the import stops early (database error), `stopped_at_line`
+    is the first line not imported; the rows reported as created are kept.
+    """
+    if user.role != "landlord" and not user.is_superuser:
+        raise HTTPException(status_code=403, detail="Only landlords can post properties")
     
-    if image_urls:
-        for idx, url in enumerate(image_urls):
-            img = PropertyImage(property_id=property_obj.id, image_url=url, position=idx)
-            session.add(img)
+    file_format = detect_format(file.filename, file.content_type)
+    if not file_format:
+        raise HTTPException(status_code=400, detail="Upload a .csv or .ndjson file")
+    
+    return await import_properties(session, user.id, file.file, file_format)
 
-    await session.commit()
+@router.patch("/bulk", response_model=schemas.PropertyBulkUpdateResult)
+async def bulk_update_properties(
+    bulk_in: schemas.PropertyBulkUpdate,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Apply the same changes (price, activation...) to many of the landlord's listings
+    in one UPDATE. Ids of listings the landlord does not own are ignored.
+    """
+    if user.role != "landlord":
+        raise HTTPException(status_code=403, detail="Not a landlord")
     
-    stmt = select(Property).options(
-        selectinload(Property.amenities), 
-        selectinload(Property.images)
-    ).where(Property.id == property_obj.id)
+    changes = bulk_in.changes.model_dump(exclude_unset=True, exclude_none=True)
+    if not changes:
+        raise HTTPException(status_code=400, detail="No changes to apply")
+    
+    # One array parameter whatever the number of ids
+    ids = bindparam("ids", list(dict.fromkeys(bulk_in.ids)), type_=ARRAY(Uuid))
+    stmt = (
+        update(Property)
+        .where(Property.landlord_id == user.id, Property.id == any_(ids))
+        .values(**changes)
+        .returning(Property.id)
+        .execution_options(synchronize_session=False)
+    )
     result = await session.execute(stmt)
-    property_obj = result.scalar_one()
-
-    return property_obj
+    updated_ids = result.scalars().all()
+    await session.commit()
+    
+    for property_id in updated_ids:
+        invalidate_property(property_id)
+    return schemas.PropertyBulkUpdateResult(updated_ids=updated_ids)
 
 @router.patch("/{property_id}", response_model=schemas.PropertyRead)
 async def update_property(
@@ -138,16 +479,38 @@ async def update_property(
         setattr(prop, key, value)
         
     if property_in.amenity_ids is not None:
-        stmt_del = delete(PropertyAmenity).where(PropertyAmenity.property_id == prop.id)
-        await session.execute(stmt_del)
+        amenity_ids = list(dict.fromkeys(property_in.amenity_ids))
+        amenities_by_id = {amenity.id: amenity for amenity in prop.amenities}
+        # Only touch the links that changed: editors resend the full list on every save
+        removed_ids = amenities_by_id.keys() - set(amenity_ids)
+        added_ids = [amenity_id for amenity_id in amenity_ids if amenity_id not in amenities_by_id]
+        
+        if added_ids:
+            result = await session.execute(select(Amenity).where(Amenity.id.in_(added_ids)))
+            added = result.scalars().all()
+            if len(added) != len(added_ids):
+                raise HTTPException(status_code=400, detail="Unknown amenity")
+            amenities_by_id.update((amenity.id, amenity) for amenity in added)
+        
+        if removed_ids:
+            await session.execute(
+                delete(PropertyAmenity).where(
+                    PropertyAmenity.property_id == prop.id,
+                    PropertyAmenity.amenity_id.in_(removed_ids)
+                )
+            )
+        if added_ids:
+            await session.execute(
+                insert(PropertyAmenity),
+                [{"property_id": prop.id, "amenity_id": amenity_id} for amenity_id in added_ids]
+            )
         
-        for amenity_id in property_in.amenity_ids:
-            prop_amenity = PropertyAmenity(property_id=prop.id, amenity_id=amenity_id)
-            session.add(prop_amenity)
+        prop.amenity_ids = amenity_ids
+        set_committed_value(prop, "amenities", [amenities_by_id[amenity_id] for amenity_id in amenity_ids])
 
     session.add(prop)
     await session.commit()
-    await session.refresh(prop)
+    invalidate_property(prop.id)
     return prop
 
 @router.delete("/{property_id}")
@@ -169,4 +532,5 @@ async def delete_property(
     
     await session.delete(prop)
     await session.commit()
+    invalidate_property(property_id)
     return {"message": "Property deleted"}
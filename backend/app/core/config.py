@@ -28,6 +28,18 @@ class Settings(BaseSettings):
     CLOUDINARY_API_KEY: Optional[str] = None
     CLOUDINARY_API_SECRET: Optional[str] = None
     
+    # Property detail cache (per worker process), 0 disables it
+    PROPERTY_CACHE_SIZE: int = 1024
+    PROPERTY_CACHE_TTL_SECONDS: int = 60
+    
+    # Search facet counts cache (per worker process)
+    FACET_CACHE_SIZE: int = 256
+    FACET_CACHE_TTL_SECONDS: int = 30
+    
+    # Swipe deck: how many of the newest unswiped candidates are scored to pick each deck.
+    # Older listings outside this window are never ranked.
+    DECK_CANDIDATE_POOL: int = 500
+    
     @computed_field
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> PostgresDsn:
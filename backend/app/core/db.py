@@ -1,7 +1,10 @@
+from typing import Awaitable, Callable, TypeVar
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlmodel import SQLModel
 from app.core.config import settings
 
+T = TypeVar("T")
+
 engine = create_async_engine(
     str(settings.SQLALCHEMY_DATABASE_URI),
     future=True,
@@ -18,6 +21,14 @@ async def get_async_session() -> AsyncSession:
     async with async_session_maker() as session:
         yield session
 
+async def run_in_session(fn: Callable[..., Awaitable[T]], *args) -> T:
+    """
+    Run `fn(session, *args)` in a session of its own, for work that may outlive the request
+    that started it (e.g. a fetch shared by concurrent requests).
+    """
+    async with async_session_maker() as session:
+        return await fn(session, *args)
+
 async def init_db():
     async with engine.begin() as conn:
         # verify connection
@@ -0,0 +1,30 @@
+"""
+ETag helpers for conditional GETs (If-None-Match / 304 Not Modified).
+
+ETags are derived from a version of the data (e.g. `updated_at`, or a row count and the
+latest `updated_at` for a collection), so a match can be answered without building the body.
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Response, status
+
+
+def make_etag(*version) -> str:
+    """Strong ETag identifying one version of a representation."""
+    digest = hashlib.sha256("|".join(str(part) for part in version).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value matches `etag` (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,85 @@
+import math
+from typing import List, Optional, Tuple
+
+# Listings are bucketed on a fixed lat/lng grid so radius and bounding-box searches
+# can be narrowed with a plain B-tree lookup on `properties.geo_cell` (no PostGIS needed).
+# 10 cells per degree is about 11 km of latitude per cell.
+GEO_CELLS_PER_DEGREE = 10
+GEO_GRID_COLUMNS = 360 * GEO_CELLS_PER_DEGREE
+
+# Same formula as `grid_cell`, evaluated by Postgres for the generated column.
+GEO_CELL_SQL = (
+    f"floor((latitude + 90) * {GEO_CELLS_PER_DEGREE})::integer * {GEO_GRID_COLUMNS}"
+    f" + least(floor((longitude + 180) * {GEO_CELLS_PER_DEGREE})::integer, {GEO_GRID_COLUMNS - 1})"
+)
+
+# Above this many cells an IN list stops paying off; callers fall back to lat/lng ranges.
+MAX_SEARCH_CELLS = 1000
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE_LAT = 111.32
+
+# min_lat, max_lat, min_lng, max_lng. A box crossing the antimeridian (±180) has
+# min_lng > max_lng, e.g. (-20, -10, 170, -170) spans 20 degrees of longitude.
+BoundingBox = Tuple[float, float, float, float]
+
+
+def grid_cell(latitude: float, longitude: float) -> int:
+    """Return the grid cell containing a point."""
+    row = math.floor((latitude + 90) * GEO_CELLS_PER_DEGREE)
+    # longitude 180 wraps onto the last column instead of the next row
+    column = min(math.floor((longitude + 180) * GEO_CELLS_PER_DEGREE), GEO_GRID_COLUMNS - 1)
+    return row * GEO_GRID_COLUMNS + column
+
+
+def radius_bounding_box(latitude: float, longitude: float, radius_km: float) -> BoundingBox:
+    """
+    Return the smallest lat/lng box containing the circle around a point.
+    Longitudes wrap around, so the box may cross the antimeridian (min_lng > max_lng).
+    """
+    delta_lat = radius_km / KM_PER_DEGREE_LAT
+    # Avoid dividing by ~0 near the poles
+    cos_lat = max(math.cos(math.radians(latitude)), 0.01)
+    delta_lng = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    min_lat, max_lat = max(latitude - delta_lat, -90.0), min(latitude + delta_lat, 90.0)
+    if delta_lng >= 180:
+        return min_lat, max_lat, -180.0, 180.0
+    return min_lat, max_lat, wrap_longitude(longitude - delta_lng), wrap_longitude(longitude + delta_lng)
+
+
+def wrap_longitude(longitude: float) -> float:
+    """Bring a longitude back into [-180, 180]."""
+    if longitude < -180:
+        return longitude + 360
+    if longitude > 180:
+        return longitude - 360
+    return longitude
+
+
+def longitude_ranges(min_lng: float, max_lng: float) -> List[Tuple[float, float]]:
+    """Split the longitudes of a box into ranges not crossing the antimeridian."""
+    if min_lng <= max_lng:
+        return [(min_lng, max_lng)]
+    return [(min_lng, 180.0), (-180.0, max_lng)]
+
+
+def cells_in_bounding_box(bbox: BoundingBox) -> Optional[List[int]]:
+    """
+    Return every grid cell intersecting a bounding box,
+    or None when the box covers more than MAX_SEARCH_CELLS cells.
+    """
+    min_lat, max_lat, min_lng, max_lng = bbox
+    cells = []
+    for range_min_lng, range_max_lng in longitude_ranges(min_lng, max_lng):
+        min_cell, max_cell = grid_cell(min_lat, range_min_lng), grid_cell(max_lat, range_max_lng)
+        min_row, min_column = divmod(min_cell, GEO_GRID_COLUMNS)
+        max_row, max_column = divmod(max_cell, GEO_GRID_COLUMNS)
+
+        if len(cells) + (max_row - min_row + 1) * (max_column - min_column + 1) > MAX_SEARCH_CELLS:
+            return None
+        cells.extend(
+            row * GEO_GRID_COLUMNS + column
+            for row in range(min_row, max_row + 1)
+            for column in range(min_column, max_column + 1)
+        )
+    return cells
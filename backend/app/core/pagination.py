@@ -0,0 +1,35 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+
+# Response header carrying the cursor of the next page (keyset pagination).
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: Optional[datetime], row_id: uuid.UUID) -> str:
+    """
+    Encode the sort key of the last row of a page into an opaque cursor.
+    """
+    payload = [sort_value.isoformat() if sort_value else None, str(row_id)]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], uuid.UUID]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+    Raises a 400 if the cursor has been tampered with.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, row_id = json.loads(raw)
+        return (
+            datetime.fromisoformat(sort_value) if sort_value else None,
+            uuid.UUID(row_id),
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -0,0 +1,42 @@
+"""
+Request coalescing ("single flight").
+
+Concurrent callers asking for the same key share one in-flight call and its result (or
+exception) instead of each running it. Nothing is kept once the call completes: pair it
+with a cache to also serve later callers.
+
+The call outlives the caller that started it, so it must not borrow that caller's
+resources, such as its database session (see `app.core.db.run_in_session`).
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Future"] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run `fn()`, or wait for the call already running for `key`."""
+        call = self._calls.get(key)
+        if call is None:
+            # A task so that the call completes for the other callers if its initiator is cancelled
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+
+            def done(_):
+                # Unless forgotten and replaced by a newer call meanwhile
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+
+            call.add_done_callback(done)
+        return await asyncio.shield(call)
+
+    def forget(self, key: Hashable) -> None:
+        """Make the next caller start a new call, e.g. after the data it reads changed."""
+        self._calls.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._calls)
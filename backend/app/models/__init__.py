@@ -2,3 +2,4 @@ from app.models.user import User
 from app.models.profile import StudentProfile, LandlordProfile
 from app.models.property import Property, PropertyImage, Amenity, PropertyAmenity
 from app.models.interaction import Swipe, Match, Message, Notification
+from app.models.analytics import PropertyDailyStats
@@ -0,0 +1,16 @@
+import uuid
+from datetime import date
+from sqlmodel import SQLModel, Field
+
+class PropertyDailyStats(SQLModel, table=True):
+    """
+    Per-property daily counters, kept up to date by the swipe and match endpoints
+    (see app/services/analytics.py) so that landlord stats do not scan swipes and matches.
+    """
+    __tablename__ = "property_daily_stats"
+    property_id: uuid.UUID = Field(foreign_key="properties.id", primary_key=True, ondelete="CASCADE")
+    day: date = Field(primary_key=True)
+    likes: int = 0
+    passes: int = 0
+    matches: int = 0 # accepted likes
+    rejections: int = 0
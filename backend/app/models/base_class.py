@@ -4,4 +4,5 @@ from sqlmodel import Field, SQLModel
 
 class TimestampMixin(SQLModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Bumped on every ORM or Core UPDATE of the row (used for ETags)
+    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": datetime.utcnow})
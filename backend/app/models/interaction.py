@@ -2,6 +2,7 @@ import uuid
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index, UniqueConstraint, text
 from app.models.base_class import TimestampMixin
 
 if TYPE_CHECKING:
@@ -10,6 +11,14 @@ if TYPE_CHECKING:
 
 class Swipe(SQLModel, table=True):
     __tablename__ = "swipes"
+    __table_args__ = (
+        # One swipe per student and property; its index also serves the swipe deck anti-join
+        UniqueConstraint("student_id", "property_id", name="uq_swipes_student_id_property_id"),
+        # A student's likes, newest first
+        Index("ix_swipes_student_id_is_liked_created_at", "student_id", "is_liked", "created_at"),
+        # Likes received by a property, newest first
+        Index("ix_swipes_property_id_is_liked_created_at", "property_id", "is_liked", "created_at"),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     student_id: uuid.UUID = Field(foreign_key="users.id")
     property_id: uuid.UUID = Field(foreign_key="properties.id")
@@ -22,6 +31,13 @@ class Swipe(SQLModel, table=True):
 
 class Match(TimestampMixin, SQLModel, table=True):
     __tablename__ = "matches"
+    __table_args__ = (
+        # One decision (accepted or rejected) per like
+        UniqueConstraint("swipe_id", name="uq_matches_swipe_id"),
+        # Each participant's conversations, most recent message first
+        Index("ix_matches_student_id_status_last_message_at", "student_id", "status", text("last_message_at DESC NULLS LAST")),
+        Index("ix_matches_landlord_id_status_last_message_at", "landlord_id", "status", text("last_message_at DESC NULLS LAST")),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     swipe_id: uuid.UUID = Field(foreign_key="swipes.id")
     student_id: uuid.UUID = Field(foreign_key="users.id")
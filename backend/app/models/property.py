@@ -2,12 +2,24 @@ import uuid
 from typing import Optional, List, TYPE_CHECKING
 from datetime import date
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Column, Computed, Index, Integer, Uuid, text
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import deferred
+from app.core.geo import GEO_CELL_SQL
 from app.models.base_class import TimestampMixin
 
 if TYPE_CHECKING:
     from app.models.user import User
     from app.models.interaction import Swipe, Match
 
+# Full-text search document: title weighs most, then description, then location
+PROPERTY_SEARCH_CONFIG = "french"
+PROPERTY_SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{PROPERTY_SEARCH_CONFIG}', coalesce(title, '')), 'A')"
+    f" || setweight(to_tsvector('{PROPERTY_SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+    f" || setweight(to_tsvector('{PROPERTY_SEARCH_CONFIG}', coalesce(city, '') || ' ' || coalesce(address, '')), 'C')"
+)
+
 class PropertyAmenity(SQLModel, table=True):
     __tablename__ = "property_amenities"
     property_id: uuid.UUID = Field(foreign_key="properties.id", primary_key=True)
@@ -24,6 +36,17 @@ class Amenity(SQLModel, table=True):
 
 class Property(TimestampMixin, SQLModel, table=True):
     __tablename__ = "properties"
+    __table_args__ = (
+        # Keyset pagination of the public feed: (created_at, id) DESC over active rows
+        Index("ix_properties_active_created_at_id", "created_at", "id", postgresql_where=text("is_active")),
+        # City feed sorted by recency, and city + price range searches
+        Index("ix_properties_active_city_created_at_id", "city", "created_at", "id", postgresql_where=text("is_active")),
+        Index("ix_properties_active_city_price", "city", "price", postgresql_where=text("is_active")),
+        # Radius / bounding-box searches narrow on grid cells first
+        Index("ix_properties_active_geo_cell", "geo_cell", postgresql_where=text("is_active")),
+        # Must-have amenities filter (array containment)
+        Index("ix_properties_amenity_ids", "amenity_ids", postgresql_using="gin"),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     landlord_id: uuid.UUID = Field(foreign_key="users.id")
     
@@ -40,6 +63,8 @@ class Property(TimestampMixin, SQLModel, table=True):
     postal_code: str
     latitude: Optional[float] = None
     longitude: Optional[float] = None
+    # Grid cell of (latitude, longitude), computed by Postgres (see app/core/geo.py)
+    geo_cell: Optional[int] = Field(default=None, sa_column=Column(Integer, Computed(GEO_CELL_SQL, persisted=True)))
     
     room_type: str        # e.g., 'studio', '2-room'
     furnished: bool = False
@@ -51,6 +76,12 @@ class Property(TimestampMixin, SQLModel, table=True):
     
     is_active: bool = True
     
+    # Denormalized copy of property_amenities, kept in sync by the property endpoints
+    amenity_ids: List[uuid.UUID] = Field(
+        default_factory=list,
+        sa_column=Column(ARRAY(Uuid), nullable=False, server_default="{}"),
+    )
+    
     # Relationships
     landlord: "User" = Relationship(back_populates="properties")
     amenities: List["Amenity"] = Relationship(back_populates="properties", link_model=PropertyAmenity)
@@ -58,8 +89,19 @@ class Property(TimestampMixin, SQLModel, table=True):
     swipes: List["Swipe"] = Relationship(back_populates="property")
     matches: List["Match"] = Relationship(back_populates="property")
 
+# Full-text search document, computed by Postgres. Mapped as deferred so it is only
+# used in WHERE/ORDER BY clauses and never loaded with the row.
+_search_vector = Column("search_vector", TSVECTOR, Computed(PROPERTY_SEARCH_VECTOR_SQL, persisted=True))
+Property.__table__.append_column(_search_vector)
+Index("ix_properties_search_vector", _search_vector, postgresql_using="gin")
+Property.__mapper__.add_property("search_vector", deferred(_search_vector))
+
 class PropertyImage(SQLModel, table=True):
     __tablename__ = "property_images"
+    __table_args__ = (
+        # Images of a listing in display order (eager loads, first image of compact listings)
+        Index("ix_property_images_property_id_position", "property_id", "position"),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     property_id: uuid.UUID = Field(foreign_key="properties.id")
     image_url: str
@@ -1,8 +1,8 @@
 import uuid
-from typing import Optional, List
+from typing import Dict, Literal, Optional, List
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict
-from app.schemas.property import PropertyRead
+from pydantic import BaseModel, ConfigDict, Field
+from app.schemas.property import PropertyCompactRead, PropertyRead
 
 # --- Swipes ---
 class SwipeBase(BaseModel):
@@ -19,6 +19,21 @@ class SwipeRead(SwipeBase):
     # property: PropertyRead
     model_config = ConfigDict(from_attributes=True)
 
+# Swipes accepted per batch request
+MAX_SWIPE_BATCH = 500
+
+class SwipeBatchCreate(BaseModel):
+    swipes: List[SwipeCreate] = Field(min_length=1, max_length=MAX_SWIPE_BATCH)
+
+class SwipeBatchResult(BaseModel):
+    property_id: uuid.UUID
+    status: Literal["created", "duplicate", "not_found"]
+    id: Optional[uuid.UUID] = None
+
+class SwipeWithPropertySummary(SwipeRead):
+    created_at: datetime
+    property: PropertyCompactRead
+
 from app.schemas.profile import StudentProfileRead
 class SwipeWithStudent(SwipeRead):
     student_id: uuid.UUID
@@ -26,6 +41,19 @@ class SwipeWithStudent(SwipeRead):
     student: Optional[StudentProfileRead] = None 
     pass
 
+class ReceivedLike(BaseModel):
+    """A like received by a landlord; the property is in ReceivedLikesPage.properties."""
+    id: uuid.UUID
+    student_id: uuid.UUID
+    property_id: uuid.UUID
+    created_at: datetime
+    student: Optional[StudentProfileRead] = None
+
+class ReceivedLikesPage(BaseModel):
+    # Each property of the page, once, keyed on its id
+    properties: Dict[uuid.UUID, PropertyCompactRead]
+    likes: List[ReceivedLike]
+
 # --- Matches ---
 class MatchBase(BaseModel):
     pass
@@ -43,6 +71,38 @@ class MatchRead(BaseModel):
     created_at: datetime
     model_config = ConfigDict(from_attributes=True)
 
+# Decisions accepted per batch request
+MAX_DECISION_BATCH = 500
+
+class SwipeDecision(BaseModel):
+    swipe_id: uuid.UUID
+    decision: Literal["accept", "reject"]
+
+class SwipeDecisionBatch(BaseModel):
+    decisions: List[SwipeDecision] = Field(min_length=1, max_length=MAX_DECISION_BATCH)
+
+class SwipeDecisionResult(BaseModel):
+    swipe_id: uuid.UUID
+    status: Literal["accepted", "rejected", "already_decided", "not_found"]
+    match_id: Optional[uuid.UUID] = None
+
+class Conversation(BaseModel):
+    """An accepted match as listed in the inbox, seen by one of its participants."""
+    id: uuid.UUID
+    property_id: uuid.UUID
+    property_title: str
+    property_image_url: Optional[str] = None
+    # The other participant
+    counterpart_id: uuid.UUID
+    counterpart_name: Optional[str] = None
+    counterpart_avatar_url: Optional[str] = None
+    last_message_at: Optional[datetime] = None
+    last_message_content: Optional[str] = None
+    # Messages the current user has not read
+    unread_count: int
+    created_at: datetime
+    model_config = ConfigDict(from_attributes=True)
+
 # --- Messages ---
 class MessageBase(BaseModel):
     content: str
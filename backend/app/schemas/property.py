@@ -1,7 +1,7 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 import uuid
 from datetime import date, datetime
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from app.models.property import Property, PropertyImage, Amenity
 
 # Amenities
@@ -65,6 +65,43 @@ class PropertyRead(PropertyBase):
     
     model_config = ConfigDict(from_attributes=True)
 
+class PropertyCompactRead(BaseModel):
+    """Listing summary for map and grid views."""
+    id: uuid.UUID
+    title: str
+    price: float
+    city: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    image_url: Optional[str] = None
+    
+    model_config = ConfigDict(from_attributes=True)
+
+class PriceBucketCount(BaseModel):
+    min_price: float
+    max_price: float
+    count: int
+
+class PropertyFacets(BaseModel):
+    total: int = 0
+    city: Dict[str, int] = {}
+    room_type: Dict[str, int] = {}
+    furnished: Dict[bool, int] = {}
+    price: List[PriceBucketCount] = []
+
+class PropertyImportError(BaseModel):
+    line: int
+    errors: List[str]
+
+class PropertyImportReport(BaseModel):
+    created: int = 0
+    failed: int = 0
+    # Capped, see `failed` for the number of rejected rows
+    errors: List[PropertyImportError] = []
+    # Set when the import stopped early: rows from this line on were not imported
+    stopped_at_line: Optional[int] = None
+    error: Optional[str] = None
+
 class PropertyUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
@@ -85,3 +122,46 @@ class PropertyUpdate(BaseModel):
     min_duration_months: Optional[int] = None
     is_active: Optional[bool] = None
     amenity_ids: Optional[List[uuid.UUID]] = None # Full update (replace)
+
+# Listings changed per bulk update request
+MAX_BULK_UPDATE = 1000
+
+class PropertyBulkChanges(BaseModel):
+    """Fields that can be changed on many listings at once."""
+    price: Optional[float] = None
+    charges_included: Optional[float] = None
+    deposit: Optional[float] = None
+    furnished: Optional[bool] = None
+    available_from: Optional[date] = None
+    min_duration_months: Optional[int] = None
+    is_active: Optional[bool] = None
+
+class PropertyBulkUpdate(BaseModel):
+    ids: List[uuid.UUID] = Field(min_length=1, max_length=MAX_BULK_UPDATE)
+    changes: PropertyBulkChanges
+
+class PropertyBulkUpdateResult(BaseModel):
+    # Listings of the landlord among `ids`; other ids are ignored
+    updated_ids: List[uuid.UUID]
+
+# Longest period served by GET /properties/me/stats
+MAX_STATS_DAYS = 366
+
+class PropertyDayStats(BaseModel):
+    day: date
+    likes: int = 0
+    passes: int = 0
+    matches: int = 0
+    rejections: int = 0
+
+class PropertyStats(BaseModel):
+    """A listing's totals over the requested period, and the days with activity."""
+    property_id: uuid.UUID
+    title: str
+    likes: int = 0
+    passes: int = 0
+    matches: int = 0
+    rejections: int = 0
+    # Matches per like over the period, None without likes
+    match_rate: Optional[float] = None
+    days: List[PropertyDayStats] = []
@@ -148,6 +148,7 @@ async def create_properties(session: AsyncSession, users: Dict[str, User], ameni
         available_from=date.today(),
         is_active=True
     )
+    p1.amenity_ids = [a.id for a in amenities[:3]]
     session.add(p1)
     await session.commit() 
     await session.refresh(p1)
@@ -175,6 +176,7 @@ async def create_properties(session: AsyncSession, users: Dict[str, User], ameni
         available_from=date.today() + timedelta(days=10),
         is_active=True
     )
+    p2.amenity_ids = [a.id for a in amenities[2:]]
     session.add(p2)
     await session.commit()
     await session.refresh(p2)
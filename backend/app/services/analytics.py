@@ -0,0 +1,53 @@
+"""
+Per-property daily counters (`PropertyDailyStats`) behind the landlord stats.
+
+Endpoints that create or remove swipes and matches call `record_stats` in the same
+transaction as their write, so the rollup commits (or rolls back) with it. Counters are
+added with an upsert, which is safe when concurrent requests update the same row.
+"""
+import uuid
+from collections import Counter
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.analytics import PropertyDailyStats
+
+STAT_FIELDS = ("likes", "passes", "matches", "rejections")
+
+
+def stats_day(at: Optional[datetime] = None) -> date:
+    """Day (UTC) an event is counted on."""
+    return (at or datetime.utcnow()).date()
+
+
+async def record_stats(session: AsyncSession, changes: Dict[Tuple[uuid.UUID, date], Counter]) -> None:
+    """
+    Add `changes` (counts by field, per property and day) to the counters, in one statement.
+    Counts may be negative, e.g. when a swipe is removed. Does not commit.
+    """
+    # Sorted so that concurrent calls lock the rows they share in the same order (no deadlock)
+    rows = [
+        {"property_id": property_id, "day": day, **{field: counts.get(field, 0) for field in STAT_FIELDS}}
+        for (property_id, day), counts in sorted(changes.items(), key=lambda item: item[0])
+        if any(counts.values())
+    ]
+    if not rows:
+        return
+    stmt = insert(PropertyDailyStats).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PropertyDailyStats.property_id, PropertyDailyStats.day],
+        set_={field: getattr(PropertyDailyStats, field) + getattr(stmt.excluded, field) for field in STAT_FIELDS},
+    )
+    await session.execute(stmt)
+
+
+def swipe_field(is_liked: bool) -> str:
+    return "likes" if is_liked else "passes"
+
+
+async def record_event(session: AsyncSession, property_id: uuid.UUID, field: str, at: Optional[datetime] = None, delta: int = 1) -> None:
+    """Count one event of a property, on the day of `at` (default: now)."""
+    await record_stats(session, {(property_id, stats_day(at)): Counter({field: delta})})
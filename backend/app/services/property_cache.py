@@ -0,0 +1,68 @@
+"""
+Serialized `PropertyRead` payloads (with their ETag) served by GET /properties/{property_id},
+serialized search facets, and coalescing of concurrent property reads.
+Endpoints that change a property, its amenities or its images must call `invalidate_property`.
+Fetches take the property's generation before reading it and only cache the result if no
+invalidation happened meanwhile, so a read racing a write cannot put stale data back.
+"""
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Tuple
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.etag import make_etag
+from app.core.singleflight import SingleFlight
+
+# (etag, payload)
+property_cache: TTLCache[Tuple[str, bytes]] = TTLCache(
+    maxsize=settings.PROPERTY_CACHE_SIZE,
+    ttl=settings.PROPERTY_CACHE_TTL_SECONDS,
+)
+
+# In-flight detail fetches, keyed on property id
+property_flight = SingleFlight()
+
+# In-flight feed queries, keyed on the full tuple of list filters
+feed_flight = SingleFlight()
+
+# Serialized `PropertyFacets`, keyed on SearchFilters. Not invalidated on writes: counts
+# may lag behind by up to the TTL.
+facet_cache: TTLCache[bytes] = TTLCache(
+    maxsize=settings.FACET_CACHE_SIZE,
+    ttl=settings.FACET_CACHE_TTL_SECONDS,
+)
+facet_flight = SingleFlight()
+
+# Generation of each recently invalidated property, as a count of invalidations (oldest first).
+# Bounded like `property_cache`: ids dropped from it report the generation of the latest
+# dropped entry, which only makes reads in progress skip caching.
+_invalidation_count = 0
+_invalidated_at: "OrderedDict[uuid.UUID, int]" = OrderedDict()
+_forgotten_generation = 0
+
+
+def property_generation(property_id: uuid.UUID) -> int:
+    return _invalidated_at.get(property_id, _forgotten_generation)
+
+
+def invalidate_property(property_id: uuid.UUID) -> None:
+    global _invalidation_count, _forgotten_generation
+    _invalidation_count += 1
+    _invalidated_at[property_id] = _invalidation_count
+    _invalidated_at.move_to_end(property_id)
+    while len(_invalidated_at) > max(settings.PROPERTY_CACHE_SIZE, 1):
+        _, _forgotten_generation = _invalidated_at.popitem(last=False)
+    property_cache.invalidate(property_id)
+    property_flight.forget(property_id)
+
+
+def cache_property_payload(property_id: uuid.UUID, generation: int, cached: Tuple[str, bytes]) -> None:
+    """Cache a payload read at `generation`, unless the property was invalidated since."""
+    if property_generation(property_id) == generation:
+        property_cache.set(property_id, cached)
+
+
+def property_etag(property_id: uuid.UUID, updated_at: datetime) -> str:
+    return make_etag(property_id, updated_at.isoformat())
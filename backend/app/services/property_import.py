@@ -0,0 +1,249 @@
+"""
+Bulk property import from CSV or NDJSON files.
+
+Rows are read one at a time from the uploaded file, validated with `PropertyCreate` and
+written in batches of multi-row INSERTs (properties, amenity links, images), one
+transaction per batch. Only the current batch is held in memory, so memory use does not
+depend on the file size.
+
+Every problem ends up in the report, never as an exception: lines that are not UTF-8 or
+not parseable are rejected like invalid rows, and a database error rolls back the current
+batch and stops the import, reporting the first line not imported. Rows reported as
+created are committed, so a client can resume from `stopped_at_line`.
+
+CSV files have a header row with `PropertyCreate` field names; empty cells are left to
+their defaults and `amenity_ids` / `image_urls` hold `|`-separated values. NDJSON files
+have one `PropertyCreate` JSON object per line.
+"""
+import codecs
+import csv
+import json
+import uuid
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.models.property import Amenity, Property, PropertyAmenity, PropertyImage
+from app.schemas.property import PropertyCreate, PropertyImportError, PropertyImportReport
+
+# File extension or content type -> format
+IMPORT_FORMATS = {
+    ".csv": "csv",
+    "text/csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    "application/x-ndjson": "ndjson",
+}
+
+# Rows written per transaction
+IMPORT_BATCH_SIZE = 500
+
+# Rows reported in detail; later errors are only counted
+MAX_REPORTED_ERRORS = 1000
+
+LIST_SEPARATOR = "|"
+LIST_FIELDS = ("amenity_ids", "image_urls")
+
+# (line number in the file, raw row or None, parse error or None)
+RawRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str]) -> Optional[str]:
+    """Format of an uploaded file from its extension, or else its content type."""
+    if filename and "." in filename:
+        file_format = IMPORT_FORMATS.get(filename[filename.rindex("."):].lower())
+        if file_format:
+            return file_format
+    return IMPORT_FORMATS.get((content_type or "").split(";")[0].strip().lower())
+
+
+class LineDecoder:
+    """
+    Decode a binary file line by line (a leading BOM is dropped). Lines that are not valid
+    UTF-8 are decoded with replacement characters and their numbers kept in `bad_lines`.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.bad_lines: Set[int] = set()
+
+    def __iter__(self) -> Iterator[str]:
+        for number, raw in enumerate(self.stream, start=1):
+            if number == 1 and raw.startswith(codecs.BOM_UTF8):
+                raw = raw[len(codecs.BOM_UTF8):]
+            try:
+                yield raw.decode("utf-8")
+            except UnicodeDecodeError:
+                self.bad_lines.add(number)
+                yield raw.decode("utf-8", errors="replace")
+
+    def pop_bad(self, first: int, last: int) -> bool:
+        """Whether a line from `first` to `last` was not valid UTF-8 (forgets them)."""
+        bad = {number for number in self.bad_lines if number <= last}
+        self.bad_lines -= bad
+        return any(number >= first for number in bad)
+
+
+INVALID_UTF8 = "Not valid UTF-8"
+
+
+def iter_csv_rows(stream: BinaryIO) -> Iterator[RawRow]:
+    lines = LineDecoder(stream)
+    reader = csv.DictReader(lines)
+    while True:
+        first = reader.line_num + 1
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            # The reader resumes at the next line. DictReader.line_num is only updated
+            # on success, the underlying reader's is the line that failed.
+            line = reader.reader.line_num
+            lines.pop_bad(first, line)
+            yield line, None, f"Invalid CSV: {e}"
+            continue
+        # Line of the row's last physical line (1 is the header)
+        line = reader.line_num
+        if lines.pop_bad(first, line):
+            yield line, None, INVALID_UTF8
+            continue
+        if None in row:
+            yield line, None, "More values than columns"
+            continue
+        data = {}
+        for key, value in row.items():
+            if value is None or value.strip() == "":
+                continue
+            if key in LIST_FIELDS:
+                data[key] = [item.strip() for item in value.split(LIST_SEPARATOR) if item.strip()]
+            else:
+                data[key] = value.strip()
+        yield line, data, None
+
+
+def iter_ndjson_rows(stream: BinaryIO) -> Iterator[RawRow]:
+    lines = LineDecoder(stream)
+    for line, raw in enumerate(lines, start=1):
+        if lines.pop_bad(line, line):
+            yield line, None, INVALID_UTF8
+            continue
+        if not raw.strip():
+            continue
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError as e:
+            yield line, None, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(data, dict):
+            yield line, None, "Expected a JSON object"
+            continue
+        yield line, data, None
+
+
+def iter_rows(stream: BinaryIO, file_format: str) -> Iterator[RawRow]:
+    if file_format == "csv":
+        return iter_csv_rows(stream)
+    return iter_ndjson_rows(stream)
+
+
+def format_validation_error(error: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(loc) for loc in detail['loc'])}: {detail['msg']}" if detail["loc"] else detail["msg"]
+        for detail in error.errors()
+    ]
+
+
+async def write_batch(session: AsyncSession, landlord_id: uuid.UUID, batch: List[PropertyCreate]) -> None:
+    """Insert a batch of validated rows with one multi-row INSERT per table, then commit."""
+    property_rows, amenity_rows, image_rows = [], [], []
+    for property_in in batch:
+        amenity_ids = list(dict.fromkeys(property_in.amenity_ids or []))
+        prop = Property(
+            **property_in.model_dump(exclude={"amenity_ids", "image_urls"}),
+            landlord_id=landlord_id,
+            amenity_ids=amenity_ids,
+        )
+        # geo_cell is generated by Postgres
+        property_rows.append(prop.model_dump(exclude={"geo_cell"}))
+        amenity_rows.extend({"property_id": prop.id, "amenity_id": amenity_id} for amenity_id in amenity_ids)
+        image_rows.extend(
+            {"id": uuid.uuid4(), "property_id": prop.id, "image_url": url, "position": idx}
+            for idx, url in enumerate(property_in.image_urls or [])
+        )
+
+    await session.execute(insert(Property), property_rows)
+    if amenity_rows:
+        await session.execute(insert(PropertyAmenity), amenity_rows)
+    if image_rows:
+        await session.execute(insert(PropertyImage), image_rows)
+    await session.commit()
+
+
+async def import_properties(
+    session: AsyncSession,
+    landlord_id: uuid.UUID,
+    stream: BinaryIO,
+    file_format: str,
+    batch_size: Optional[int] = None,
+) -> PropertyImportReport:
+    """Import every valid row of the file for a landlord and report the others."""
+    batch_size = batch_size or IMPORT_BATCH_SIZE
+    result = await session.execute(select(Amenity.id))
+    known_amenity_ids: Set[uuid.UUID] = set(result.scalars().all())
+
+    report = PropertyImportReport()
+
+    def reject(line: int, errors: List[str]) -> None:
+        report.failed += 1
+        if len(report.errors) < MAX_REPORTED_ERRORS:
+            report.errors.append(PropertyImportError(line=line, errors=errors))
+
+    async def write(batch: List[Tuple[int, PropertyCreate]]) -> bool:
+        try:
+            await write_batch(session, landlord_id, [property_in for _, property_in in batch])
+        except SQLAlchemyError:
+            # Only this batch is lost, the previous ones are committed
+            await session.rollback()
+            report.stopped_at_line = batch[0][0]
+            report.error = f"Database error, rows from line {report.stopped_at_line} on were not imported"
+            return False
+        report.created += len(batch)
+        return True
+
+    rows = iter_rows(stream, file_format)
+    batch: List[Tuple[int, PropertyCreate]] = []
+    while True:
+        # Reading the upload blocks: read and parse each chunk off the event loop
+        chunk = await run_in_threadpool(list, islice(rows, batch_size))
+        if not chunk:
+            break
+        for line, data, parse_error in chunk:
+            if parse_error:
+                reject(line, [parse_error])
+                continue
+            try:
+                property_in = PropertyCreate.model_validate(data)
+            except ValidationError as e:
+                reject(line, format_validation_error(e))
+                continue
+            unknown = [str(a) for a in property_in.amenity_ids or [] if a not in known_amenity_ids]
+            if unknown:
+                reject(line, [f"amenity_ids: unknown amenity {amenity_id}" for amenity_id in unknown])
+                continue
+
+            batch.append((line, property_in))
+            if len(batch) >= batch_size:
+                if not await write(batch):
+                    return report
+                batch = []
+
+    if batch:
+        await write(batch)
+    return report
@@ -0,0 +1,232 @@
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import exists, func, literal_column, or_, tuple_
+from sqlalchemy.sql import ColumnElement, Select
+from sqlmodel import select, desc
+
+from app.core.geo import (
+    EARTH_RADIUS_KM,
+    BoundingBox,
+    cells_in_bounding_box,
+    longitude_ranges,
+    radius_bounding_box,
+)
+from app.models.interaction import Swipe
+from app.models.profile import StudentProfile
+from app.models.property import Property, PropertyImage, PROPERTY_SEARCH_CONFIG
+
+# latitude, longitude, radius in km
+Circle = Tuple[float, float, float]
+
+# Width of the price facet buckets, in euros
+PRICE_BUCKET_SIZE = 100
+
+
+@dataclass(frozen=True)
+class SearchFilters:
+    """Public search filters shared by the feed and its facets (hashable, used as cache key)."""
+    city: Optional[str] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    bbox: Optional[BoundingBox] = None
+    text_query: Optional[str] = None
+    amenity_ids: Tuple[uuid.UUID, ...] = ()
+    near: Optional[Circle] = None
+
+
+# Image shown on compact listings: the first one in display order
+first_image_url = (
+    select(PropertyImage.image_url)
+    .where(PropertyImage.property_id == Property.id)
+    .order_by(PropertyImage.position, PropertyImage.id)
+    .limit(1)
+    .correlate(Property)
+    .scalar_subquery()
+)
+
+# Deck candidates cost at most this multiple of the student's max budget (the budget
+# score is already 0 there)
+DECK_MAX_BUDGET_RATIO = 2
+
+# Columns of `PropertyCompactRead`
+SUMMARY_COLUMNS = (
+    Property.id,
+    Property.title,
+    Property.price,
+    Property.city,
+    Property.latitude,
+    Property.longitude,
+    first_image_url.label("image_url"),
+)
+
+# Plus created_at for the feed cursor
+COMPACT_COLUMNS = (*SUMMARY_COLUMNS, Property.created_at)
+
+
+def distance_km(latitude: float, longitude: float) -> ColumnElement:
+    """Haversine distance in km between a point and each property."""
+    lat1, lng1 = func.radians(latitude), func.radians(longitude)
+    lat2, lng2 = func.radians(Property.latitude), func.radians(Property.longitude)
+    a = (
+        func.power(func.sin((lat2 - lat1) / 2), 2)
+        + func.cos(lat1) * func.cos(lat2) * func.power(func.sin((lng2 - lng1) / 2), 2)
+    )
+    return 2 * EARTH_RADIUS_KM * func.asin(func.least(1.0, func.sqrt(a)))
+
+
+def text_search(text_query: str) -> ColumnElement:
+    """Parse a user keyword query ("balcon métro", "studio -colocation") into a tsquery."""
+    config = literal_column(f"'{PROPERTY_SEARCH_CONFIG}'::regconfig")
+    return func.websearch_to_tsquery(config, text_query)
+
+
+def within_bounding_box(query: Select, bbox: BoundingBox) -> Select:
+    """Restrict a query to properties located inside a lat/lng box, which may cross ±180."""
+    min_lat, max_lat, min_lng, max_lng = bbox
+    cells = cells_in_bounding_box(bbox)
+    if cells is not None:
+        # Index lookup on the grid cells first, exact coordinates check afterwards
+        query = query.where(Property.geo_cell.in_(cells))
+    return query.where(
+        Property.latitude.between(min_lat, max_lat),
+        or_(*(Property.longitude.between(low, high) for low, high in longitude_ranges(min_lng, max_lng))),
+    )
+
+
+def filter_properties(
+    query: Select,
+    city: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    bbox: Optional[BoundingBox] = None,
+    text_query: Optional[str] = None,
+    amenity_ids: Optional[List[uuid.UUID]] = None,
+) -> Select:
+    """
+    Apply the public search filters to a query over Property.
+    Only active listings are ever returned, which matches the partial indexes on `properties`.
+    """
+    if amenity_ids:
+        # Listings having every requested amenity
+        query = query.where(Property.amenity_ids.contains(amenity_ids))
+    if text_query:
+        query = query.where(Property.search_vector.op("@@")(text_search(text_query)))
+    if city:
+        query = query.where(Property.city == city)
+    if min_price:
+        query = query.where(Property.price >= min_price)
+    if max_price:
+        query = query.where(Property.price <= max_price)
+    if bbox:
+        query = within_bounding_box(query, bbox)
+    return query.where(Property.is_active == True)
+
+
+def within_radius(query: Select, near: Circle) -> Select:
+    """Restrict a query to properties within `radius_km` of a point."""
+    latitude, longitude, radius_km = near
+    query = within_bounding_box(query, radius_bounding_box(latitude, longitude, radius_km))
+    return query.where(distance_km(latitude, longitude) <= radius_km)
+
+
+def search_properties(query: Select, filters: SearchFilters) -> Select:
+    """Apply every search filter, including the radius, to a query over Property."""
+    query = filter_properties(
+        query,
+        city=filters.city,
+        min_price=filters.min_price,
+        max_price=filters.max_price,
+        bbox=filters.bbox,
+        text_query=filters.text_query,
+        amenity_ids=list(filters.amenity_ids),
+    )
+    if filters.near:
+        query = within_radius(query, filters.near)
+    return query
+
+
+def feed_query(
+    filters: SearchFilters,
+    after: Optional[Tuple[datetime, uuid.UUID]] = None,
+    skip: int = 0,
+    limit: int = 100,
+) -> Select:
+    """
+    Build the public feed query.
+    With `near`, only properties within the circle are returned, closest first.
+    Otherwise keyword searches (`text_query`) are ranked by relevance, and the plain feed
+    is newest first: `after` is then the (created_at, id) of the last row already served
+    (keyset pagination); without it the page is selected with `skip`.
+    """
+    query = search_properties(select(Property), filters)
+
+    if filters.near:
+        latitude, longitude, _ = filters.near
+        query = query.order_by(distance_km(latitude, longitude), Property.id)
+        return query.offset(skip).limit(limit)
+
+    if filters.text_query:
+        rank = func.ts_rank_cd(Property.search_vector, text_search(filters.text_query))
+        query = query.order_by(rank.desc(), desc(Property.created_at), desc(Property.id))
+        return query.offset(skip).limit(limit)
+
+    query = query.order_by(desc(Property.created_at), desc(Property.id))
+    if after:
+        query = query.where(tuple_(Property.created_at, Property.id) < after)
+    else:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+def facet_query(filters: SearchFilters) -> Select:
+    """
+    Count the matching properties per city, room type, furnished and price bucket, and
+    in total, in one scan (GROUPING SETS). Each row holds one facet value and its count,
+    the other facet columns are NULL (the faceted columns themselves are never NULL);
+    the total row has them all NULL.
+    """
+    # Inlined so that the SELECT and GROUP BY expressions are identical (no bind parameters)
+    bucket_size = literal_column(str(PRICE_BUCKET_SIZE))
+    price_bucket = (func.floor(Property.price / bucket_size) * bucket_size).label("price_bucket")
+    query = select(
+        Property.city,
+        Property.room_type,
+        Property.furnished,
+        price_bucket,
+        func.count().label("count"),
+    )
+    query = search_properties(query.select_from(Property), filters)
+    return query.group_by(
+        func.grouping_sets(
+            tuple_(Property.city),
+            tuple_(Property.room_type),
+            tuple_(Property.furnished),
+            tuple_(price_bucket),
+            tuple_(),
+        )
+    )
+
+
+def deck_query(student_id: uuid.UUID, profile: Optional[StudentProfile] = None, limit: int = 20) -> Select:
+    """
+    Build the swipe deck candidates of a student: active properties they have not swiped
+    yet (anti-join on swipes), newest first.
+    The profile only filters on city and on a price ceiling; budget fit, room type and
+    furnished are soft criteria left to the scoring (app/services/scoring.py).
+    """
+    already_swiped = exists().where(Swipe.student_id == student_id, Swipe.property_id == Property.id)
+    query = select(Property).where(~already_swiped)
+
+    if profile:
+        query = filter_properties(
+            query,
+            city=profile.city,
+            max_price=profile.budget_max * DECK_MAX_BUDGET_RATIO if profile.budget_max else None,
+        )
+    else:
+        query = filter_properties(query)
+
+    return query.order_by(desc(Property.created_at), desc(Property.id)).limit(limit)
@@ -0,0 +1,125 @@
+"""
+Student / property compatibility scoring.
+
+Candidates are loaded as column arrays (one NumPy array per property field) and scored
+against a StudentProfile in a single vectorized pass, so thousands of candidates can be
+ranked per request without a Python loop over rows.
+
+Each criterion yields a score in [0, 1]; criteria the student left empty score a neutral
+0.5 so they do not change the ranking. Properties have no pets/smoker policy fields yet,
+so those profile fields are not scored.
+"""
+import uuid
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from app.models.profile import StudentProfile
+from app.models.property import Property
+
+# Columns needed to score a property, in `CandidateColumns.from_rows` order
+SCORING_COLUMNS = (
+    Property.id,
+    Property.price,
+    Property.city,
+    Property.room_type,
+    Property.furnished,
+)
+
+WEIGHTS = {
+    "budget": 4.0,
+    "city": 3.0,
+    "room_type": 2.0,
+    "furnished": 1.0,
+    "guarantor": 2.0,
+}
+
+# French landlords usually expect the guarantor to earn 3x the rent
+GUARANTOR_INCOME_RATIO = 3.0
+
+NEUTRAL = 0.5
+
+
+@dataclass
+class CandidateColumns:
+    """Candidate properties stored column-wise."""
+    ids: np.ndarray
+    price: np.ndarray
+    city: np.ndarray
+    room_type: np.ndarray
+    furnished: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple]) -> "CandidateColumns":
+        """Build the columns from rows selected with SCORING_COLUMNS."""
+        rows = list(rows)
+        if not rows:
+            return cls(*(np.empty(0) for _ in SCORING_COLUMNS))
+        ids, price, city, room_type, furnished = zip(*rows)
+        return cls(
+            ids=np.array(ids, dtype=object),
+            price=np.array(price, dtype=np.float64),
+            city=np.array(city, dtype=str),
+            room_type=np.array(room_type, dtype=str),
+            furnished=np.array(furnished, dtype=bool),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def _match(values: np.ndarray, wanted) -> np.ndarray:
+    """1.0 where the column equals the wanted value, neutral when nothing is wanted."""
+    if wanted is None:
+        return np.full(len(values), NEUTRAL)
+    return (values == wanted).astype(np.float64)
+
+
+def _budget(price: np.ndarray, budget_min, budget_max) -> np.ndarray:
+    """1.0 inside the budget, decaying linearly to 0 at twice the maximum budget."""
+    if budget_max is None and budget_min is None:
+        return np.full(len(price), NEUTRAL)
+    score = np.ones(len(price))
+    if budget_max:
+        over = np.clip((price - budget_max) / budget_max, 0.0, 1.0)
+        score -= over
+    if budget_min:
+        # Listings well under the budget are usually not what the student is looking for
+        under = np.clip((budget_min - price) / budget_min, 0.0, 1.0)
+        score -= 0.5 * under
+    return np.clip(score, 0.0, 1.0)
+
+
+def _guarantor(price: np.ndarray, guarantor_income) -> np.ndarray:
+    """How well the guarantor income covers the rent, 1.0 at GUARANTOR_INCOME_RATIO and above."""
+    if guarantor_income is None:
+        return np.full(len(price), NEUTRAL)
+    with np.errstate(divide="ignore"):
+        coverage = guarantor_income / (GUARANTOR_INCOME_RATIO * price)
+    return np.clip(np.nan_to_num(coverage, posinf=1.0), 0.0, 1.0)
+
+
+def score_candidates(profile: StudentProfile, candidates: CandidateColumns) -> np.ndarray:
+    """Return the compatibility score (0-1) of every candidate, in candidate order."""
+    if not len(candidates):
+        return np.empty(0)
+    scores = (
+        WEIGHTS["budget"] * _budget(candidates.price, profile.budget_min, profile.budget_max)
+        + WEIGHTS["city"] * _match(candidates.city, profile.city)
+        + WEIGHTS["room_type"] * _match(candidates.room_type, profile.room_type)
+        + WEIGHTS["furnished"] * _match(candidates.furnished, profile.furnished)
+        + WEIGHTS["guarantor"] * _guarantor(candidates.price, profile.guarantor_income)
+    )
+    return scores / sum(WEIGHTS.values())
+
+
+def rank_candidates(profile: StudentProfile, candidates: CandidateColumns, limit: int) -> List[uuid.UUID]:
+    """
+    Return the ids of the `limit` best candidates, best first.
+    Ties keep the candidates' original order (e.g. newest first).
+    """
+    scores = score_candidates(profile, candidates)
+    order = np.argsort(-scores, kind="stable")[:limit]
+    return list(candidates.ids[order])
+
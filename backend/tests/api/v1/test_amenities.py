@@ -1,16 +1,17 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import text
 
 
-async def create_superuser_with_token(client: AsyncClient):
+async def create_superuser_with_token(client: AsyncClient, email: str = "admin@test.com"):
     """Helper to create superuser and return token."""
     # Note: In real app, superuser creation might be different
     # For testing, we'll create a regular user and manually set superuser flag
     # This is a simplified approach for testing
-    register_data = {"email": "admin@test.com", "password": "password123", "role": "landlord"}
+    register_data = {"email": email, "password": "password123", "role": "landlord"}
     await client.post("/api/v1/auth/register", json=register_data)
     
-    login_data = {"username": "admin@test.com", "password": "password123"}
+    login_data = {"username": email, "password": "password123"}
     response = await client.post("/api/v1/auth/login", data=login_data)
     return response.json()["access_token"]
 
@@ -76,3 +77,60 @@ async def test_regular_user_cannot_create_amenity(client: AsyncClient):
         headers={"Authorization": f"Bearer {token}"}
     )
     assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_list_amenities_etag(client: AsyncClient):
+    """Test conditional GETs on the amenity list."""
+    response = await client.get("/api/v1/amenities/")
+    etag = response.headers["ETag"]
+    
+    response = await client.get("/api/v1/amenities/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    
+    response = await client.get("/api/v1/amenities/", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.headers["ETag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_delete_amenity_updates_properties(client: AsyncClient, db_session, create_amenities):
+    """Test that deleting an amenity removes it from the listings offering it, and their caches."""
+    balcony_id, garden_id = await create_amenities("Balcony", "Garden")
+    
+    email = "admin_delete_amenity@test.com"
+    token = await create_superuser_with_token(client, email)
+    await db_session.execute(text("UPDATE users SET is_superuser = true WHERE email = :email"), {"email": email})
+    await db_session.commit()
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    property_data = {
+        "title": "Green",
+        "description": "Outdoor space",
+        "price": 700.0,
+        "surface": 30.0,
+        "city": "Gardenville",
+        "address": "Rue",
+        "postal_code": "75001",
+        "room_type": "studio",
+        "available_from": "2026-03-01",
+        "amenity_ids": [balcony_id, garden_id]
+    }
+    response = await client.post("/api/v1/properties/", json=property_data, headers=headers)
+    property_id = response.json()["id"]
+    # Cached, with its ETag
+    response = await client.get(f"/api/v1/properties/{property_id}")
+    etag = response.headers["ETag"]
+    
+    response = await client.delete(f"/api/v1/amenities/{garden_id}", headers=headers)
+    assert response.status_code == 200
+    
+    response = await client.get(f"/api/v1/properties/{property_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert [a["name"] for a in response.json()["amenities"]] == ["Balcony"]
+    
+    amenity_ids = text("SELECT amenity_ids FROM properties WHERE id = :id")
+    assert [str(a) for a in (await db_session.execute(amenity_ids, {"id": property_id})).scalar_one()] == [balcony_id]
+    response = await client.get("/api/v1/properties/", params={"amenities": garden_id})
+    assert response.json() == []
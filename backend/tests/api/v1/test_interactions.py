@@ -1,3 +1,5 @@
+import asyncio
+import uuid
 import pytest
 from httpx import AsyncClient
 
@@ -140,6 +142,35 @@ async def test_get_my_likes(client: AsyncClient):
     assert all(swipe["is_liked"] for swipe in data)
 
 
+
+@pytest.mark.asyncio
+async def test_my_likes_summaries_and_cursor(client: AsyncClient):
+    """Test likes come newest first with a property summary, paged by cursor."""
+    landlord_token = await create_landlord_with_token(client, "landlord_likes_cursor@test.com")
+    student_token = await create_student_with_token(client, "student_likes_cursor@test.com")
+    headers = {"Authorization": f"Bearer {student_token}"}
+    
+    for i in range(3):
+        property_id = await create_property(client, landlord_token, f"Liked {i}")
+        await client.post("/api/v1/interactions/swipe", json={"property_id": property_id, "is_liked": True}, headers=headers)
+    disliked_id = await create_property(client, landlord_token, "Disliked")
+    await client.post("/api/v1/interactions/swipe", json={"property_id": disliked_id, "is_liked": False}, headers=headers)
+    
+    response = await client.get("/api/v1/interactions/my-likes", params={"limit": 2}, headers=headers)
+    assert response.status_code == 200
+    page = response.json()
+    assert [like["property"]["title"] for like in page] == ["Liked 2", "Liked 1"]
+    assert page[0]["property"]["id"] == page[0]["property_id"]
+    assert page[0]["property"]["price"] == 800.0
+    
+    response = await client.get(
+        "/api/v1/interactions/my-likes",
+        params={"limit": 2, "cursor": response.headers["X-Next-Cursor"]},
+        headers=headers
+    )
+    assert [like["property"]["title"] for like in response.json()] == ["Liked 0"]
+    assert "X-Next-Cursor" not in response.headers
+
 @pytest.mark.asyncio
 async def test_remove_like(client: AsyncClient):
     """Test student removing a like."""
@@ -199,6 +230,54 @@ async def test_landlord_received_likes(client: AsyncClient):
     assert len(data) == 2
 
 
+
+@pytest.mark.asyncio
+async def test_received_likes_normalized(client: AsyncClient):
+    """Test the normalized inbox: each property once, likes paged by cursor."""
+    landlord_token = await create_landlord_with_token(client, "landlord_inbox@test.com")
+    headers = {"Authorization": f"Bearer {landlord_token}"}
+    flat_id = await create_property(client, landlord_token, "Flat")
+    loft_id = await create_property(client, landlord_token, "Loft")
+    
+    for i in range(3):
+        student_token = await create_student_with_token(client, f"student{i}_inbox@test.com")
+        for property_id in (flat_id, loft_id):
+            await client.post(
+                "/api/v1/interactions/swipe",
+                json={"property_id": property_id, "is_liked": True},
+                headers={"Authorization": f"Bearer {student_token}"}
+            )
+    
+    response = await client.get(
+        "/api/v1/interactions/landlord/received-likes",
+        params={"view": "normalized", "limit": 4},
+        headers=headers
+    )
+    assert response.status_code == 200
+    page = response.json()
+    assert {p["title"] for p in page["properties"].values()} == {"Flat", "Loft"}
+    assert len(page["likes"]) == 4
+    assert all(like["property_id"] in page["properties"] for like in page["likes"])
+    assert page["likes"][0]["student"]["first_name"] == "Test"
+    created = [like["created_at"] for like in page["likes"]]
+    assert created == sorted(created, reverse=True)
+    
+    response = await client.get(
+        "/api/v1/interactions/landlord/received-likes",
+        params={"view": "normalized", "limit": 4, "cursor": response.headers["X-Next-Cursor"]},
+        headers=headers
+    )
+    assert len(response.json()["likes"]) == 2
+    
+    response = await client.get(
+        "/api/v1/interactions/landlord/received-likes",
+        params={"view": "normalized", "property_id": loft_id},
+        headers=headers
+    )
+    page = response.json()
+    assert list(page["properties"]) == [loft_id]
+    assert len(page["likes"]) == 3
+
 @pytest.mark.asyncio
 async def test_accept_swipe_creates_match(client: AsyncClient):
     """Test landlord accepting a swipe creates a match."""
@@ -319,3 +398,397 @@ async def test_cannot_swipe_twice(client: AsyncClient):
         headers={"Authorization": f"Bearer {student_token}"}
     )
     assert response.status_code == 400
+
+
+
+@pytest.mark.asyncio
+async def test_concurrent_swipes_insert_once(client: AsyncClient):
+    """Test that racing swipes on the same property only record one."""
+    landlord_token = await create_landlord_with_token(client, "landlord_race@test.com")
+    student_token = await create_student_with_token(client, "student_race@test.com")
+    
+    property_id = await create_property(client, landlord_token)
+    
+    swipe_data = {"property_id": property_id, "is_liked": True}
+    headers = {"Authorization": f"Bearer {student_token}"}
+    responses = await asyncio.gather(*[
+        client.post("/api/v1/interactions/swipe", json=swipe_data, headers=headers)
+        for _ in range(5)
+    ])
+    
+    assert sorted(r.status_code for r in responses) == [200, 400, 400, 400, 400]
+    
+    response = await client.get("/api/v1/interactions/my-likes", headers=headers)
+    assert [like["property_id"] for like in response.json()] == [property_id]
+
+
+@pytest.mark.asyncio
+async def test_swipe_unknown_property(client: AsyncClient):
+    """Test swiping a property that does not exist."""
+    student_token = await create_student_with_token(client, "student_unknown@test.com")
+    
+    response = await client.post(
+        "/api/v1/interactions/swipe",
+        json={"property_id": str(uuid.uuid4()), "is_liked": True},
+        headers={"Authorization": f"Bearer {student_token}"}
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_swipe_batch(client: AsyncClient):
+    """Test recording several swipes in one request."""
+    landlord_token = await create_landlord_with_token(client, "landlord_batch@test.com")
+    student_token = await create_student_with_token(client, "student_batch@test.com")
+    headers = {"Authorization": f"Bearer {student_token}"}
+    
+    liked_id = await create_property(client, landlord_token, "Batch Liked")
+    passed_id = await create_property(client, landlord_token, "Batch Passed")
+    swiped_id = await create_property(client, landlord_token, "Batch Swiped")
+    unknown_id = str(uuid.uuid4())
+    await client.post(
+        "/api/v1/interactions/swipe",
+        json={"property_id": swiped_id, "is_liked": True},
+        headers=headers
+    )
+    
+    response = await client.post(
+        "/api/v1/interactions/swipes:batch",
+        json={"swipes": [
+            {"property_id": liked_id, "is_liked": True},
+            {"property_id": passed_id, "is_liked": False},
+            {"property_id": swiped_id, "is_liked": False},
+            {"property_id": unknown_id, "is_liked": True},
+            {"property_id": liked_id, "is_liked": False},
+        ]},
+        headers=headers
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["property_id"] for r in results] == [liked_id, passed_id, swiped_id, unknown_id, liked_id]
+    assert [r["status"] for r in results] == ["created", "created", "duplicate", "not_found", "duplicate"]
+    assert results[0]["id"] is not None
+    
+    response = await client.get("/api/v1/interactions/my-likes", headers=headers)
+    assert {like["property_id"] for like in response.json()} == {liked_id, swiped_id}
+    
+    # Too many swipes in one batch
+    response = await client.post(
+        "/api/v1/interactions/swipes:batch",
+        json={"swipes": [{"property_id": liked_id, "is_liked": True}] * 501},
+        headers=headers
+    )
+    assert response.status_code == 422
+
+@pytest.mark.asyncio
+async def test_swipe_deck(client: AsyncClient):
+    """Test the deck serves unswiped properties of the student's city, best fit first."""
+    landlord_token = await create_landlord_with_token(client, "landlord_deck@test.com")
+    student_token = await create_student_with_token(client, "student_deck@test.com")
+    
+    await client.patch(
+        "/api/v1/profiles/student",
+        json={"city": "Deckville", "budget_min": 400, "budget_max": 800, "room_type": "studio"},
+        headers={"Authorization": f"Bearer {student_token}"}
+    )
+    
+    # Created oldest first
+    listings = [
+        ("Deck Match 1", 500.0, "studio", "Deckville"),
+        ("Deck Match 2", 700.0, "studio", "Deckville"),
+        ("Deck Too Expensive", 1200.0, "studio", "Deckville"),
+        ("Deck Wrong Type", 600.0, "T2", "Deckville"),
+        ("Deck Way Too Expensive", 1700.0, "studio", "Deckville"),
+        ("Deck Wrong City", 500.0, "studio", "Elsewhere"),
+    ]
+    property_ids = {}
+    for title, price, room_type, city in listings:
+        property_data = {
+            "title": title,
+            "description": "Deck",
+            "price": price,
+            "surface": 25.0,
+            "city": city,
+            "address": "Rue",
+            "postal_code": "75001",
+            "room_type": room_type,
+            "available_from": "2026-03-01"
+        }
+        response = await client.post(
+            "/api/v1/properties/",
+            json=property_data,
+            headers={"Authorization": f"Bearer {landlord_token}"}
+        )
+        property_ids[title] = response.json()["id"]
+    
+    response = await client.get(
+        "/api/v1/interactions/deck",
+        headers={"Authorization": f"Bearer {student_token}"}
+    )
+    assert response.status_code == 200
+    # Ranked on fit, not recency: the soft criteria (budget, room type) reorder the deck,
+    # while another city or more than twice the max budget leave it
+    assert [p["title"] for p in response.json()] == [
+        "Deck Match 2", "Deck Match 1", "Deck Wrong Type", "Deck Too Expensive"
+    ]
+    
+    # Swiped properties leave the deck
+    await client.post(
+        "/api/v1/interactions/swipe",
+        json={"property_id": property_ids["Deck Match 2"], "is_liked": False},
+        headers={"Authorization": f"Bearer {student_token}"}
+    )
+    response = await client.get(
+        "/api/v1/interactions/deck",
+        headers={"Authorization": f"Bearer {student_token}"}
+    )
+    assert [p["title"] for p in response.json()] == ["Deck Match 1", "Deck Wrong Type", "Deck Too Expensive"]
+    
+    # Landlords have no deck
+    response = await client.get(
+        "/api/v1/interactions/deck",
+        headers={"Authorization": f"Bearer {landlord_token}"}
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_landlord_property_stats(client: AsyncClient):
+    """Test the per-property stats rollup kept by swipes, matches and rejections."""
+    landlord_token = await create_landlord_with_token(client, "landlord_stats@test.com")
+    landlord_headers = {"Authorization": f"Bearer {landlord_token}"}
+    students = [
+        {"Authorization": f"Bearer {await create_student_with_token(client, f'student_stats{i}@test.com')}"}
+        for i in range(4)
+    ]
+    
+    busy_id = await create_property(client, landlord_token, "Stats Busy")
+    quiet_id = await create_property(client, landlord_token, "Stats Quiet")
+    
+    swipe_ids = []
+    for headers in students[:3]:
+        response = await client.post(
+            "/api/v1/interactions/swipe",
+            json={"property_id": busy_id, "is_liked": True},
+            headers=headers
+        )
+        swipe_ids.append(response.json()["id"])
+    await client.post(
+        "/api/v1/interactions/swipes:batch",
+        json={"swipes": [{"property_id": busy_id, "is_liked": False}]},
+        headers=students[3]
+    )
+    await client.post(f"/api/v1/interactions/landlord/accept-swipe/{swipe_ids[0]}", headers=landlord_headers)
+    await client.post(f"/api/v1/interactions/landlord/reject-swipe/{swipe_ids[1]}", headers=landlord_headers)
+    # Removed likes are uncounted
+    await client.delete(f"/api/v1/interactions/swipe/{busy_id}", headers=students[2])
+    
+    response = await client.get("/api/v1/properties/me/stats", headers=landlord_headers)
+    assert response.status_code == 200
+    stats = {item["property_id"]: item for item in response.json()}
+    assert set(stats) == {busy_id, quiet_id}
+    
+    busy = stats[busy_id]
+    assert (busy["likes"], busy["passes"], busy["matches"], busy["rejections"]) == (2, 1, 1, 1)
+    assert busy["match_rate"] == 0.5
+    assert len(busy["days"]) == 1
+    assert busy["days"][0]["likes"] == 2
+    
+    quiet = stats[quiet_id]
+    assert (quiet["likes"], quiet["passes"], quiet["match_rate"], quiet["days"]) == (0, 0, None, [])
+    
+    # Outside the period
+    response = await client.get(
+        "/api/v1/properties/me/stats",
+        params={"from": "2020-01-01", "to": "2020-01-31"},
+        headers=landlord_headers
+    )
+    assert all(item["days"] == [] and item["likes"] == 0 for item in response.json())
+    
+    response = await client.get(
+        "/api/v1/properties/me/stats",
+        params={"from": "2020-02-01", "to": "2020-01-01"},
+        headers=landlord_headers
+    )
+    assert response.status_code == 400
+    
+    response = await client.get("/api/v1/properties/me/stats", headers=students[0])
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_decide_swipes_batch(client: AsyncClient, sql_statements):
+    """Test accepting and rejecting several likes in one request."""
+    landlord_token = await create_landlord_with_token(client, "landlord_decide@test.com")
+    other_token = await create_landlord_with_token(client, "landlord_decide_other@test.com")
+    landlord_headers = {"Authorization": f"Bearer {landlord_token}"}
+    
+    property_id = await create_property(client, landlord_token, "Decide Mine")
+    other_property_id = await create_property(client, other_token, "Decide Other")
+    
+    swipe_ids = []
+    for i in range(4):
+        student_token = await create_student_with_token(client, f"student_decide{i}@test.com")
+        response = await client.post(
+            "/api/v1/interactions/swipe",
+            json={"property_id": property_id, "is_liked": True},
+            headers={"Authorization": f"Bearer {student_token}"}
+        )
+        swipe_ids.append(response.json()["id"])
+    response = await client.post(
+        "/api/v1/interactions/swipe",
+        json={"property_id": other_property_id, "is_liked": True},
+        headers={"Authorization": f"Bearer {student_token}"}
+    )
+    other_swipe_id = response.json()["id"]
+    await client.post(f"/api/v1/interactions/landlord/accept-swipe/{swipe_ids[3]}", headers=landlord_headers)
+    
+    sql_statements.clear()
+    response = await client.post(
+        "/api/v1/interactions/landlord/decisions:batch",
+        json={"decisions": [
+            {"swipe_id": swipe_ids[0], "decision": "accept"},
+            {"swipe_id": swipe_ids[1], "decision": "reject"},
+            {"swipe_id": swipe_ids[2], "decision": "accept"},
+            {"swipe_id": swipe_ids[0], "decision": "reject"},
+            {"swipe_id": swipe_ids[3], "decision": "reject"},
+            {"swipe_id": other_swipe_id, "decision": "accept"},
+        ]},
+        headers=landlord_headers
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["swipe_id"] for r in results] == [swipe_ids[0], swipe_ids[1], swipe_ids[2], swipe_ids[0], swipe_ids[3], other_swipe_id]
+    assert [r["status"] for r in results] == ["accepted", "rejected", "accepted", "already_decided", "already_decided", "not_found"]
+    assert results[0]["match_id"] is not None
+    # One insert per table, whatever the batch size
+    assert len([s for s in sql_statements if s.lstrip().upper().startswith("INSERT INTO MATCHES")]) == 1
+    assert len([s for s in sql_statements if s.lstrip().upper().startswith("INSERT INTO NOTIFICATIONS")]) == 1
+    
+    response = await client.get("/api/v1/interactions/matches", headers=landlord_headers)
+    assert {m["swipe_id"] for m in response.json()} == {swipe_ids[0], swipe_ids[2], swipe_ids[3]}
+    
+    response = await client.get("/api/v1/properties/me/stats", headers=landlord_headers)
+    stats = response.json()[0]
+    assert (stats["matches"], stats["rejections"]) == (3, 1)
+    
+    response = await client.post(
+        "/api/v1/interactions/landlord/decisions:batch",
+        json={"decisions": [{"swipe_id": swipe_ids[0], "decision": "accept"}]},
+        headers={"Authorization": f"Bearer {student_token}"}
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_concurrent_decisions_create_one_match(client: AsyncClient):
+    """Test that repeated and racing accepts/rejects of a like create a single match."""
+    landlord_token = await create_landlord_with_token(client, "landlord_decide_race@test.com")
+    landlord_headers = {"Authorization": f"Bearer {landlord_token}"}
+    property_id = await create_property(client, landlord_token)
+    
+    students, swipe_ids = [], []
+    for i in range(2):
+        headers = {"Authorization": f"Bearer {await create_student_with_token(client, f'student_decide_race{i}@test.com')}"}
+        response = await client.post(
+            "/api/v1/interactions/swipe",
+            json={"property_id": property_id, "is_liked": True},
+            headers=headers
+        )
+        students.append(headers)
+        swipe_ids.append(response.json()["id"])
+    
+    accepts = await asyncio.gather(*[
+        client.post(f"/api/v1/interactions/landlord/accept-swipe/{swipe_ids[0]}", headers=landlord_headers)
+        for _ in range(5)
+    ])
+    assert [r.status_code for r in accepts] == [200] * 5
+    assert len({r.json()["id"] for r in accepts}) == 1
+    
+    rejects = await asyncio.gather(*[
+        client.post(f"/api/v1/interactions/landlord/reject-swipe/{swipe_ids[1]}", headers=landlord_headers)
+        for _ in range(5)
+    ])
+    assert [r.status_code for r in rejects] == [200] * 5
+    
+    # The opposite decision is refused
+    response = await client.post(f"/api/v1/interactions/landlord/reject-swipe/{swipe_ids[0]}", headers=landlord_headers)
+    assert response.status_code == 400
+    response = await client.post(f"/api/v1/interactions/landlord/accept-swipe/{swipe_ids[1]}", headers=landlord_headers)
+    assert response.status_code == 400
+    response = await client.post(
+        "/api/v1/interactions/landlord/decisions:batch",
+        json={"decisions": [{"swipe_id": swipe_ids[1], "decision": "accept"}]},
+        headers=landlord_headers
+    )
+    assert [r["status"] for r in response.json()] == ["already_decided"]
+    
+    # One notification per student, counted once in the stats
+    for headers, notification_type in zip(students, ["match_created", "match_rejected"]):
+        response = await client.get("/api/v1/notifications/", headers=headers)
+        assert [n["type"] for n in response.json()] == [notification_type]
+    response = await client.get("/api/v1/properties/me/stats", headers=landlord_headers)
+    stats = response.json()[0]
+    assert (stats["matches"], stats["rejections"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_conversations(client: AsyncClient, sql_statements):
+    """Test the inbox: matches by last message, with property and counterpart, paged by cursor."""
+    landlord_token = await create_landlord_with_token(client, "landlord_inbox@test.com")
+    landlord_headers = {"Authorization": f"Bearer {landlord_token}"}
+    property_id = await create_property(client, landlord_token, "Inbox Property")
+    
+    students, match_ids = [], []
+    for i in range(4):
+        headers = {"Authorization": f"Bearer {await create_student_with_token(client, f'student_inbox{i}@test.com')}"}
+        response = await client.post(
+            "/api/v1/interactions/swipe",
+            json={"property_id": property_id, "is_liked": True},
+            headers=headers
+        )
+        response = await client.post(
+            f"/api/v1/interactions/landlord/accept-swipe/{response.json()['id']}",
+            headers=landlord_headers
+        )
+        students.append(headers)
+        match_ids.append(response.json()["id"])
+    
+    # Messages in matches 1 then 0: 0 is the most recent, 2 and 3 have none
+    for idx in (1, 0):
+        await client.post(
+            "/api/v1/messages/",
+            json={"match_id": match_ids[idx], "content": f"Hello {idx}"},
+            headers=students[idx]
+        )
+    
+    sql_statements.clear()
+    response = await client.get("/api/v1/interactions/conversations", headers=landlord_headers)
+    assert response.status_code == 200
+    assert len([s for s in sql_statements if "FROM matches" in s]) == 1
+    conversations = response.json()
+    assert [c["id"] for c in conversations[:2]] == [match_ids[0], match_ids[1]]
+    assert {c["id"] for c in conversations[2:]} == {match_ids[2], match_ids[3]}
+    first = conversations[0]
+    assert first["property_title"] == "Inbox Property"
+    assert first["counterpart_name"] == "Test Student"
+    assert first["last_message_content"] == "Hello 0"
+    assert first["unread_count"] == 1
+    
+    # Cursor pages cross from matches with messages to matches without
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 1, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/api/v1/interactions/conversations", params=params, headers=landlord_headers)
+        seen.extend(c["id"] for c in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert seen == [c["id"] for c in conversations]
+    
+    # The student sees the landlord
+    response = await client.get("/api/v1/interactions/conversations", headers=students[0])
+    conversations = response.json()
+    assert [c["id"] for c in conversations] == [match_ids[0]]
+    assert conversations[0]["counterpart_name"] == "Test Company"
+    assert conversations[0]["unread_count"] == 0
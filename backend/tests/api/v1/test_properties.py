@@ -1,5 +1,13 @@
+import asyncio
+import json
+import uuid
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from app.api.v1.endpoints import properties
+from app.services import property_import
+from app.services.property_cache import property_cache
 
 
 async def create_landlord_with_token(client: AsyncClient, email: str = "landlord_prop@test.com"):
@@ -324,3 +332,797 @@ async def test_unauthorized_update(client: AsyncClient):
         headers={"Authorization": f"Bearer {token2}"}
     )
     assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_list_properties_cursor_pagination(client: AsyncClient):
+    """Test walking the feed with keyset cursors."""
+    token = await create_landlord_with_token(client, "landlord_cursor@test.com")
+    
+    for i in range(5):
+        property_data = {
+            "title": f"Cursor Property {i}",
+            "description": "Paged",
+            "price": 600.0 + i,
+            "surface": 20.0,
+            "city": "Cursorville",
+            "address": f"{i} Rue",
+            "postal_code": "75001",
+            "room_type": "studio",
+            "available_from": "2026-03-01"
+        }
+        await client.post(
+            "/api/v1/properties/",
+            json=property_data,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+    
+    seen = []
+    response = await client.get("/api/v1/properties/?city=Cursorville&limit=2")
+    assert response.status_code == 200
+    seen += [p["title"] for p in response.json()]
+    
+    while "x-next-cursor" in response.headers:
+        response = await client.get(
+            "/api/v1/properties/",
+            params={"city": "Cursorville", "limit": 2, "cursor": response.headers["x-next-cursor"]}
+        )
+        assert response.status_code == 200
+        seen += [p["title"] for p in response.json()]
+    
+    # Newest first, every property exactly once
+    assert seen == [f"Cursor Property {i}" for i in reversed(range(5))]
+
+
+@pytest.mark.asyncio
+async def test_list_properties_invalid_cursor(client: AsyncClient):
+    """Test that a malformed cursor is rejected."""
+    response = await client.get("/api/v1/properties/?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_properties_radius_search(client: AsyncClient):
+    """Test radius search returns nearby properties sorted by distance."""
+    token = await create_landlord_with_token(client, "landlord_geo@test.com")
+    
+    # Around Reykjavik so no other test data is nearby
+    locations = [
+        ("Geo Far", 64.40, -21.90),    # ~33 km north
+        ("Geo Near", 64.15, -21.94),   # ~1.8 km
+        ("Geo Center", 64.1355, -21.8954),
+    ]
+    for title, latitude, longitude in locations:
+        property_data = {
+            "title": title,
+            "description": "Geo",
+            "price": 900.0,
+            "surface": 30.0,
+            "city": "Reykjavik",
+            "address": "Street",
+            "postal_code": "101",
+            "latitude": latitude,
+            "longitude": longitude,
+            "room_type": "studio",
+            "available_from": "2026-03-01"
+        }
+        await client.post(
+            "/api/v1/properties/",
+            json=property_data,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+    
+    response = await client.get("/api/v1/properties/?lat=64.1355&lng=-21.8954&radius_km=5")
+    assert response.status_code == 200
+    assert [p["title"] for p in response.json()] == ["Geo Center", "Geo Near"]
+    
+    response = await client.get("/api/v1/properties/?lat=64.1355&lng=-21.8954&radius_km=50")
+    assert [p["title"] for p in response.json()] == ["Geo Center", "Geo Near", "Geo Far"]
+    
+    # Bounding box around the northern listing only
+    response = await client.get(
+        "/api/v1/properties/?min_lat=64.3&max_lat=64.5&min_lng=-22.0&max_lng=-21.8"
+    )
+    assert [p["title"] for p in response.json()] == ["Geo Far"]
+    
+    # Incomplete circle
+    response = await client.get("/api/v1/properties/?lat=64.1355&lng=-21.8954")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_geo_search_across_antimeridian(client: AsyncClient):
+    """Test radius and bounding-box searches around longitude 180."""
+    token = await create_landlord_with_token(client, "landlord_antimeridian@test.com")
+    
+    # Taveuni (Fiji) straddles the antimeridian
+    locations = [
+        ("Meridian West", -16.80, 179.95),
+        ("Meridian East", -16.80, -179.95),
+        ("Meridian Far", -16.80, -179.00),  # ~106 km east
+    ]
+    for title, latitude, longitude in locations:
+        property_data = {
+            "title": title,
+            "description": "Geo",
+            "price": 900.0,
+            "surface": 30.0,
+            "city": "Taveuni",
+            "address": "Street",
+            "postal_code": "0000",
+            "latitude": latitude,
+            "longitude": longitude,
+            "room_type": "studio",
+            "available_from": "2026-03-01"
+        }
+        await client.post(
+            "/api/v1/properties/",
+            json=property_data,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+    
+    response = await client.get("/api/v1/properties/?lat=-16.80&lng=179.95&radius_km=20")
+    assert response.status_code == 200
+    assert [p["title"] for p in response.json()] == ["Meridian West", "Meridian East"]
+    
+    # min_lng > max_lng: the box crosses the antimeridian
+    response = await client.get(
+        "/api/v1/properties/?min_lat=-17&max_lat=-16.5&min_lng=179.9&max_lng=-179.5"
+    )
+    assert sorted(p["title"] for p in response.json()) == ["Meridian East", "Meridian West"]
+
+
+@pytest.mark.asyncio
+async def test_list_properties_keyword_search(client: AsyncClient):
+    """Test keyword search matches title/description and ranks by relevance."""
+    token = await create_landlord_with_token(client, "landlord_search@test.com")
+    
+    properties = [
+        {"title": "Studio avec balcon", "description": "Lumineux, proche du métro Bastille"},
+        {"title": "Chambre calme", "description": "Petit balcon sur cour"},
+        {"title": "T2 rénové", "description": "Cuisine équipée"},
+    ]
+    for prop in properties:
+        property_data = {
+            **prop,
+            "price": 700.0,
+            "surface": 25.0,
+            "city": "Searchville",
+            "address": "Rue",
+            "postal_code": "75011",
+            "room_type": "studio",
+            "available_from": "2026-03-01"
+        }
+        await client.post(
+            "/api/v1/properties/",
+            json=property_data,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+    
+    response = await client.get("/api/v1/properties/", params={"q": "balcon métro", "city": "Searchville"})
+    assert response.status_code == 200
+    assert [p["title"] for p in response.json()] == ["Studio avec balcon"]
+    
+    response = await client.get("/api/v1/properties/", params={"q": "balcon", "city": "Searchville"})
+    # Title matches rank above description matches
+    assert [p["title"] for p in response.json()] == ["Studio avec balcon", "Chambre calme"]
+
+
+@pytest.mark.asyncio
+async def test_list_properties_amenity_filter(client: AsyncClient, create_amenities):
+    """Test filtering on must-have amenities, kept in sync on create and update."""
+    wifi_id, washer_id, parking_id = await create_amenities("WiFi", "Washing Machine", "Parking")
+    
+    token = await create_landlord_with_token(client, "landlord_amenities@test.com")
+    
+    property_ids = {}
+    for title, amenity_ids in [
+        ("Both", [wifi_id, washer_id]),
+        ("WiFi only", [wifi_id]),
+        ("All three", [wifi_id, washer_id, parking_id]),
+    ]:
+        property_data = {
+            "title": title,
+            "description": "Amenities",
+            "price": 650.0,
+            "surface": 20.0,
+            "city": "Amenityville",
+            "address": "Rue",
+            "postal_code": "75001",
+            "room_type": "studio",
+            "available_from": "2026-03-01",
+            "amenity_ids": amenity_ids
+        }
+        response = await client.post(
+            "/api/v1/properties/",
+            json=property_data,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        property_ids[title] = response.json()["id"]
+    
+    params = [("city", "Amenityville"), ("amenities", wifi_id), ("amenities", washer_id)]
+    response = await client.get("/api/v1/properties/", params=params)
+    assert response.status_code == 200
+    assert sorted(p["title"] for p in response.json()) == ["All three", "Both"]
+    
+    # Dropping the washing machine removes the listing from the filter
+    await client.patch(
+        f"/api/v1/properties/{property_ids['Both']}",
+        json={"amenity_ids": [wifi_id]},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    response = await client.get("/api/v1/properties/", params=params)
+    assert [p["title"] for p in response.json()] == ["All three"]
+
+
+@pytest.mark.asyncio
+async def test_create_property_with_amenities_and_images(client: AsyncClient, create_amenities):
+    """Test creating a listing with its amenities and images in one request."""
+    wifi_id, balcony_id = await create_amenities("WiFi", "Balcony")
+    
+    token = await create_landlord_with_token(client, "landlord_children@test.com")
+    property_data = {
+        "title": "Furnished studio",
+        "description": "With pictures",
+        "price": 700.0,
+        "surface": 22.0,
+        "city": "Childville",
+        "address": "Rue",
+        "postal_code": "75001",
+        "room_type": "studio",
+        "available_from": "2026-03-01",
+        "amenity_ids": [balcony_id, wifi_id],
+        "image_urls": ["https://img/1.jpg", "https://img/2.jpg"]
+    }
+    response = await client.post(
+        "/api/v1/properties/",
+        json=property_data,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [a["name"] for a in data["amenities"]] == ["Balcony", "WiFi"]
+    assert [(i["image_url"], i["position"]) for i in data["images"]] == [("https://img/1.jpg", 0), ("https://img/2.jpg", 1)]
+    
+    response = await client.get(f"/api/v1/properties/{data['id']}")
+    assert sorted(a["name"] for a in response.json()["amenities"]) == ["Balcony", "WiFi"]
+    assert len(response.json()["images"]) == 2
+    
+    # Unknown amenities are rejected before anything is written
+    property_data["amenity_ids"] = [wifi_id, "00000000-0000-0000-0000-000000000000"]
+    property_data["title"] = "Rejected"
+    response = await client.post(
+        "/api/v1/properties/",
+        json=property_data,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 400
+    response = await client.get("/api/v1/properties/", params={"city": "Childville"})
+    assert [p["title"] for p in response.json()] == ["Furnished studio"]
+
+
+@pytest.mark.asyncio
+async def test_update_property_amenities_diff(client: AsyncClient, db_session, create_amenities):
+    """Test that updating amenities only rewrites the links that changed."""
+    wifi_id, washer_id, parking_id = await create_amenities("WiFi", "Washing Machine", "Parking")
+    
+    token = await create_landlord_with_token(client, "landlord_amenity_diff@test.com")
+    property_data = {
+        "title": "Diffed",
+        "description": "Amenities",
+        "price": 650.0,
+        "surface": 20.0,
+        "city": "Diffville",
+        "address": "Rue",
+        "postal_code": "75001",
+        "room_type": "studio",
+        "available_from": "2026-03-01",
+        "amenity_ids": [wifi_id, washer_id]
+    }
+    response = await client.post(
+        "/api/v1/properties/",
+        json=property_data,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    property_id = response.json()["id"]
+    
+    # Physical location of the WiFi link row, changes if the row is deleted and re-inserted
+    wifi_link = text("SELECT ctid::text FROM property_amenities WHERE property_id = :p AND amenity_id = :a")
+    params = {"p": property_id, "a": wifi_id}
+    wifi_ctid = (await db_session.execute(wifi_link, params)).scalar_one()
+    await db_session.rollback()
+    
+    response = await client.patch(
+        f"/api/v1/properties/{property_id}",
+        json={"amenity_ids": [wifi_id, parking_id]},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200
+    assert [a["name"] for a in response.json()["amenities"]] == ["WiFi", "Parking"]
+    
+    response = await client.get(f"/api/v1/properties/{property_id}")
+    assert sorted(a["name"] for a in response.json()["amenities"]) == ["Parking", "WiFi"]
+    assert (await db_session.execute(wifi_link, params)).scalar_one() == wifi_ctid
+
+
+@pytest.mark.asyncio
+async def test_get_property_cache_invalidation(client: AsyncClient):
+    """Test that property details are cached and refreshed after an update or delete."""
+    token = await create_landlord_with_token(client, "landlord_cache@test.com")
+    property_data = {
+        "title": "Cached",
+        "description": "Cache me",
+        "price": 700.0,
+        "surface": 20.0,
+        "city": "Cacheville",
+        "address": "Rue",
+        "postal_code": "75001",
+        "room_type": "studio",
+        "available_from": "2026-03-01"
+    }
+    response = await client.post(
+        "/api/v1/properties/",
+        json=property_data,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    property_id = response.json()["id"]
+    
+    first = await client.get(f"/api/v1/properties/{property_id}")
+    hits = property_cache.hits
+    second = await client.get(f"/api/v1/properties/{property_id}")
+    assert property_cache.hits == hits + 1
+    assert second.json() == first.json()
+    
+    await client.patch(
+        f"/api/v1/properties/{property_id}",
+        json={"title": "Cached v2"},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    response = await client.get(f"/api/v1/properties/{property_id}")
+    assert response.json()["title"] == "Cached v2"
+    
+    await client.delete(f"/api/v1/properties/{property_id}", headers={"Authorization": f"Bearer {token}"})
+    response = await client.get(f"/api/v1/properties/{property_id}")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_property_cache_skips_read_racing_a_write(client: AsyncClient, db_session):
+    """Test that a read overtaken by a committed update does not cache the old listing."""
+    token = await create_landlord_with_token(client, "landlord_cache_race@test.com")
+    property_data = {
+        "title": "Old",
+        "description": "Racy",
+        "price": 700.0,
+        "surface": 20.0,
+        "city": "Raceville",
+        "address": "Rue",
+        "postal_code": "75001",
+        "room_type": "studio",
+        "available_from": "2026-03-01"
+    }
+    response = await client.post(
+        "/api/v1/properties/",
+        json=property_data,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    property_id = response.json()["id"]
+    
+    class UpdatedAfterRead:
+        """Session whose read is followed by an update committed by another request."""
+        async def execute(self, *args, **kwargs):
+            result = await db_session.execute(*args, **kwargs)
+            response = await client.patch(
+                f"/api/v1/properties/{property_id}",
+                json={"title": "New"},
+                headers={"Authorization": f"Bearer {token}"}
+            )
+            assert response.status_code == 200
+            return result
+    
+    # The read finishes after the update invalidated the cache
+    etag, payload = await properties.fetch_property_payload(UpdatedAfterRead(), uuid.UUID(property_id))
+    assert json.loads(payload)["title"] == "Old"
+    assert property_cache.get(uuid.UUID(property_id)) is None
+    
+    response = await client.get(f"/api/v1/properties/{property_id}")
+    assert response.json()["title"] == "New"
+    assert response.headers["ETag"] != etag
+    response = await client.get(f"/api/v1/properties/{property_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_query(client: AsyncClient, sql_statements):
+    """Test that a burst of identical reads runs a single set of queries."""
+    token = await create_landlord_with_token(client, "landlord_burst@test.com")
+    property_data = {
+        "title": "Shared listing",
+        "description": "Viral",
+        "price": 700.0,
+        "surface": 20.0,
+        "city": "Burstville",
+        "address": "Rue",
+        "postal_code": "75001",
+        "room_type": "studio",
+        "available_from": "2026-03-01"
+    }
+    response = await client.post(
+        "/api/v1/properties/",
+        json=property_data,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    property_id = response.json()["id"]
+    
+    sql_statements.clear()
+    responses = await asyncio.gather(*[client.get(f"/api/v1/properties/{property_id}") for _ in range(20)])
+    assert all(r.status_code == 200 and r.json()["title"] == "Shared listing" for r in responses)
+    # The property, then its amenities and images
+    assert len([s for s in sql_statements if s.startswith("SELECT")]) == 3
+    
+    sql_statements.clear()
+    responses = await asyncio.gather(*[
+        client.get("/api/v1/properties/", params={"city": "Burstville"}) for _ in range(20)
+    ])
+    assert all([p["title"] for p in r.json()] == ["Shared listing"] for r in responses)
+    assert len([s for s in sql_statements if s.startswith("SELECT")]) == 3
+
+
+@pytest.mark.asyncio
+async def test_shared_read_survives_cancelled_initiator(client: AsyncClient, monkeypatch):
+    """Test that cancelling the request that started a shared fetch does not fail the others."""
+    token = await create_landlord_with_token(client, "landlord_cancel@test.com")
+    property_data = {
+        "title": "Shared and cancelled",
+        "description": "Viral",
+        "price": 700.0,
+        "surface": 20.0,
+        "city": "Cancelville",
+        "address": "Rue",
+        "postal_code": "75001",
+        "room_type": "studio",
+        "available_from": "2026-03-01"
+    }
+    response = await client.post(
+        "/api/v1/properties/",
+        json=property_data,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    property_id = response.json()["id"]
+    
+    started = asyncio.Event()
+    fetch_property_payload = properties.fetch_property_payload
+    
+    async def slow_fetch(session, property_id):
+        started.set()
+        # Still querying when the initiator is cancelled
+        await session.execute(text("SELECT pg_sleep(0.3)"))
+        return await fetch_property_payload(session, property_id)
+    
+    monkeypatch.setattr(properties, "fetch_property_payload", slow_fetch)
+    first = asyncio.create_task(client.get(f"/api/v1/properties/{property_id}"))
+    await started.wait()
+    second = asyncio.create_task(client.get(f"/api/v1/properties/{property_id}"))
+    await asyncio.sleep(0.05)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    
+    response = await second
+    assert response.status_code == 200
+    assert response.json()["title"] == "Shared and cancelled"
+
+
+@pytest.mark.asyncio
+async def test_property_etags(client: AsyncClient):
+    """Test conditional GETs on a property and on the landlord's listings."""
+    token = await create_landlord_with_token(client, "landlord_etag@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    property_data = {
+        "title": "Tagged",
+        "description": "ETag",
+        "price": 700.0,
+        "surface": 20.0,
+        "city": "Etagville",
+        "address": "Rue",
+        "postal_code": "75001",
+        "room_type": "studio",
+        "available_from": "2026-03-01"
+    }
+    response = await client.post("/api/v1/properties/", json=property_data, headers=headers)
+    property_id = response.json()["id"]
+    
+    response = await client.get(f"/api/v1/properties/{property_id}")
+    etag = response.headers["ETag"]
+    response = await client.get(f"/api/v1/properties/{property_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    
+    # Revalidated from updated_at alone when the payload is not cached
+    property_cache.clear()
+    response = await client.get(f"/api/v1/properties/{property_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    
+    response = await client.get("/api/v1/properties/me", headers=headers)
+    my_etag = response.headers["ETag"]
+    response = await client.get("/api/v1/properties/me", headers={**headers, "If-None-Match": my_etag})
+    assert response.status_code == 304
+    
+    # Updates bump updated_at, and so both ETags
+    created_at_update = (await client.get(f"/api/v1/properties/{property_id}")).json()["updated_at"]
+    response = await client.patch(f"/api/v1/properties/{property_id}", json={"price": 720.0}, headers=headers)
+    assert response.json()["updated_at"] > created_at_update
+    
+    response = await client.get(f"/api/v1/properties/{property_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["price"] == 720.0
+    assert response.headers["ETag"] != etag
+    
+    response = await client.get("/api/v1/properties/me", headers={**headers, "If-None-Match": my_etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != my_etag
+
+
+@pytest.mark.asyncio
+async def test_list_properties_compact_view(client: AsyncClient, sql_statements):
+    """Test the compact listing view used by maps and grids."""
+    token = await create_landlord_with_token(client, "landlord_compact@test.com")
+    for title, image_urls in [("With photos", ["https://img/a.jpg", "https://img/b.jpg"]), ("No photo", [])]:
+        property_data = {
+            "title": title,
+            "description": "A long description the grid does not need",
+            "price": 700.0,
+            "surface": 20.0,
+            "city": "Compactville",
+            "address": "Rue",
+            "postal_code": "75001",
+            "latitude": 45.0,
+            "longitude": 5.0,
+            "room_type": "studio",
+            "available_from": "2026-03-01",
+            "image_urls": image_urls
+        }
+        await client.post("/api/v1/properties/", json=property_data, headers={"Authorization": f"Bearer {token}"})
+    
+    sql_statements.clear()
+    response = await client.get("/api/v1/properties/", params={"city": "Compactville", "view": "compact", "limit": 1})
+    assert response.status_code == 200
+    assert len(sql_statements) == 1
+    (item,) = response.json()
+    assert set(item) == {"id", "title", "price", "city", "latitude", "longitude", "image_url"}
+    assert item["title"] == "No photo"
+    assert item["image_url"] is None
+    
+    response = await client.get(
+        "/api/v1/properties/",
+        params={"city": "Compactville", "view": "compact", "cursor": response.headers["X-Next-Cursor"]}
+    )
+    assert [(p["title"], p["image_url"]) for p in response.json()] == [("With photos", "https://img/a.jpg")]
+
+
+@pytest.mark.asyncio
+async def test_property_facets(client: AsyncClient, sql_statements):
+    """Test facet counts over the search filters, computed in one query."""
+    token = await create_landlord_with_token(client, "landlord_facets@test.com")
+    for city, room_type, furnished, price in [
+        ("Facetville", "studio", True, 450.0),
+        ("Facetville", "studio", False, 480.0),
+        ("Facetville", "T2", True, 720.0),
+        ("Facetbourg", "studio", True, 530.0),
+    ]:
+        property_data = {
+            "title": "Faceted",
+            "description": "Counts",
+            "price": price,
+            "surface": 20.0,
+            "city": city,
+            "address": "Rue des facettes",
+            "postal_code": "75001",
+            "room_type": room_type,
+            "furnished": furnished,
+            "available_from": "2026-03-01"
+        }
+        await client.post("/api/v1/properties/", json=property_data, headers={"Authorization": f"Bearer {token}"})
+    
+    sql_statements.clear()
+    response = await client.get("/api/v1/properties/facets", params={"q": "facettes", "max_price": 600})
+    assert response.status_code == 200
+    assert len(sql_statements) == 1
+    assert response.json() == {
+        "total": 3,
+        "city": {"Facetville": 2, "Facetbourg": 1},
+        "room_type": {"studio": 3},
+        "furnished": {"true": 2, "false": 1},
+        "price": [
+            {"min_price": 400.0, "max_price": 500.0, "count": 2},
+            {"min_price": 500.0, "max_price": 600.0, "count": 1},
+        ],
+    }
+    
+    # Served from the cache
+    sql_statements.clear()
+    response = await client.get("/api/v1/properties/facets", params={"q": "facettes", "max_price": 600})
+    assert response.json()["total"] == 3
+    assert sql_statements == []
+
+
+@pytest.mark.asyncio
+async def test_import_properties(client: AsyncClient, create_amenities, monkeypatch):
+    """Test bulk importing listings from CSV and NDJSON files."""
+    # Several batches even for a small file
+    monkeypatch.setattr(property_import, "IMPORT_BATCH_SIZE", 2)
+    
+    [wifi_id] = await create_amenities("WiFi")
+    
+    token = await create_landlord_with_token(client, "landlord_import@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    csv_file = (
+        "title,description,price,surface,city,address,postal_code,room_type,available_from,amenity_ids,image_urls\n"
+        f"Unit 1,Imported,600,20,Importville,Rue,75001,studio,2026-03-01,{wifi_id},https://img/1.jpg|https://img/2.jpg\n"
+        "Unit 2,Imported,not a price,20,Importville,Rue,75001,studio,2026-03-01,,\n"
+        "Unit 3,Imported,650,20,Importville,Rue,75001,studio,2026-03-01,00000000-0000-0000-0000-000000000000,\n"
+        "Unit 4,Imported,700,20,Importville,Rue,75001,studio,2026-03-01,,\n"
+        "Unit 5,Imported,750,20,Importville,Rue,75001,studio,2026-03-01,,\n"
+    )
+    response = await client.post(
+        "/api/v1/properties/import",
+        files={"file": ("units.csv", csv_file.encode(), "text/csv")},
+        headers=headers
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["created"], report["failed"]) == (3, 2)
+    assert [e["line"] for e in report["errors"]] == [3, 4]
+    assert report["errors"][0]["errors"][0].startswith("price:")
+    
+    ndjson_file = "\n".join([
+        json.dumps({"title": "Unit 6", "description": "Imported", "price": 800, "surface": 30, "city": "Importville",
+                    "address": "Rue", "postal_code": "75001", "room_type": "T2", "available_from": "2026-03-01"}),
+        json.dumps({"title": "Unit 7"}),
+    ])
+    response = await client.post(
+        "/api/v1/properties/import",
+        files={"file": ("units.ndjson", ndjson_file.encode(), "application/x-ndjson")},
+        headers=headers
+    )
+    assert (response.json()["created"], response.json()["failed"]) == (1, 1)
+    
+    response = await client.get("/api/v1/properties/", params={"city": "Importville"})
+    properties = {p["title"]: p for p in response.json()}
+    assert sorted(properties) == ["Unit 1", "Unit 4", "Unit 5", "Unit 6"]
+    assert [a["name"] for a in properties["Unit 1"]["amenities"]] == ["WiFi"]
+    assert [i["image_url"] for i in sorted(properties["Unit 1"]["images"], key=lambda i: i["position"])] == [
+        "https://img/1.jpg", "https://img/2.jpg"
+    ]
+    
+    response = await client.post(
+        "/api/v1/properties/import",
+        files={"file": ("units.xlsx", b"binary", "application/vnd.ms-excel")},
+        headers=headers
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_stops_on_database_error(client: AsyncClient, monkeypatch):
+    """Test that a failed batch is reported, and the batches before it kept."""
+    monkeypatch.setattr(property_import, "IMPORT_BATCH_SIZE", 2)
+    write_batch = property_import.write_batch
+    calls = 0
+    
+    async def failing_second_batch(session, landlord_id, batch):
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise OperationalError("INSERT INTO properties", {}, Exception("connection lost"))
+        await write_batch(session, landlord_id, batch)
+    
+    monkeypatch.setattr(property_import, "write_batch", failing_second_batch)
+    
+    token = await create_landlord_with_token(client, "landlord_import_error@test.com")
+    csv_file = "title,description,price,surface,city,address,postal_code,room_type,available_from\n" + "".join(
+        f"Unit {i},Imported,600,20,Failville,Rue,75001,studio,2026-03-01\n" for i in range(1, 6)
+    )
+    response = await client.post(
+        "/api/v1/properties/import",
+        files={"file": ("units.csv", csv_file.encode(), "text/csv")},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["created"], report["stopped_at_line"]) == (2, 4)
+    assert report["error"].startswith("Database error")
+    
+    response = await client.get("/api/v1/properties/", params={"city": "Failville"})
+    assert sorted(p["title"] for p in response.json()) == ["Unit 1", "Unit 2"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_properties(client: AsyncClient):
+    """Test changing the price and activation of many listings at once."""
+    token = await create_landlord_with_token(client, "landlord_bulk@test.com")
+    other_token = await create_landlord_with_token(client, "landlord_bulk_other@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    property_data = {
+        "title": "Building unit",
+        "description": "Bulk",
+        "price": 600.0,
+        "surface": 20.0,
+        "city": "Bulkville",
+        "address": "Rue",
+        "postal_code": "75001",
+        "room_type": "studio",
+        "available_from": "2026-03-01"
+    }
+    mine = [
+        (await client.post("/api/v1/properties/", json=property_data, headers=headers)).json()["id"]
+        for _ in range(3)
+    ]
+    other = (await client.post(
+        "/api/v1/properties/", json=property_data, headers={"Authorization": f"Bearer {other_token}"}
+    )).json()["id"]
+    
+    # Cached before the update
+    before = (await client.get(f"/api/v1/properties/{mine[0]}")).json()
+    
+    response = await client.patch(
+        "/api/v1/properties/bulk",
+        json={"ids": mine[:2] + [other], "changes": {"price": 650.0, "is_active": False}},
+        headers=headers
+    )
+    assert response.status_code == 200
+    assert sorted(response.json()["updated_ids"]) == sorted(mine[:2])
+    
+    after = (await client.get(f"/api/v1/properties/{mine[0]}")).json()
+    assert (after["price"], after["is_active"]) == (650.0, False)
+    assert after["updated_at"] > before["updated_at"]
+    assert (await client.get(f"/api/v1/properties/{mine[2]}")).json()["price"] == 600.0
+    assert (await client.get(f"/api/v1/properties/{other}")).json()["price"] == 600.0
+    
+    response = await client.patch(
+        "/api/v1/properties/bulk",
+        json={"ids": mine, "changes": {}},
+        headers=headers
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_properties_by_ids(client: AsyncClient, sql_statements):
+    """Test fetching several properties by id, in the requested order."""
+    token = await create_landlord_with_token(client, "landlord_ids@test.com")
+    property_ids = []
+    for i in range(3):
+        property_data = {
+            "title": f"Liked {i}",
+            "description": "Batch get",
+            "price": 600.0,
+            "surface": 20.0,
+            "city": "Idville",
+            "address": "Rue",
+            "postal_code": "75001",
+            "room_type": "studio",
+            "available_from": "2026-03-01",
+            "image_urls": [f"https://img/{i}.jpg"]
+        }
+        response = await client.post("/api/v1/properties/", json=property_data, headers={"Authorization": f"Bearer {token}"})
+        property_ids.append(response.json()["id"])
+    
+    # One listing already in the detail cache
+    await client.get(f"/api/v1/properties/{property_ids[1]}")
+    
+    requested = [property_ids[2], str(uuid.uuid4()), property_ids[0], property_ids[1]]
+    sql_statements.clear()
+    response = await client.get("/api/v1/properties/", params=[("ids", i) for i in requested])
+    assert response.status_code == 200
+    assert [p["title"] for p in response.json()] == ["Liked 2", "Liked 0", "Liked 1"]
+    assert [p["images"][0]["image_url"] for p in response.json()] == ["https://img/2.jpg", "https://img/0.jpg", "https://img/1.jpg"]
+    # The misses, their amenities and their images
+    assert len(sql_statements) == 3
+    
+    response = await client.get("/api/v1/properties/", params=[("ids", i) for i in requested] + [("view", "compact")])
+    assert [p["image_url"] for p in response.json()] == ["https://img/2.jpg", "https://img/0.jpg", "https://img/1.jpg"]
+    
+    response = await client.get("/api/v1/properties/", params=[("ids", str(uuid.uuid4())) for _ in range(201)])
+    assert response.status_code == 400
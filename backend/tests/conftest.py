@@ -1,13 +1,16 @@
 import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Callable, List
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlmodel import SQLModel
 from app.main import app
 from app.core.config import settings
+from app.core import db
 from app.core.db import get_async_session
+from app.models.property import Amenity
 from app.core.config import settings
 
 # Use settings from app config but override database name for testing
@@ -40,7 +43,7 @@ async def init_test_db():
     await engine.dispose()
 
 @pytest_asyncio.fixture
-async def client() -> AsyncGenerator[AsyncClient, None]:
+async def client(monkeypatch) -> AsyncGenerator[AsyncClient, None]:
     # We must NOT share the same session instance across multiple parallel requests if they overlap,
     # but `AsyncClient` executes requests sequentially unless gathered.
     # However, `fastapi-users` or extensive logic might do background stuff or something.
@@ -53,8 +56,40 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
             yield session
 
     app.dependency_overrides[get_async_session] = override_get_async_session
+    # Sessions opened outside the dependency (`run_in_session`) go to the test database too
+    monkeypatch.setattr(db, "async_session_maker", TestingSessionLocal)
     
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
         yield c
     
     app.dependency_overrides.clear()
+
+@pytest_asyncio.fixture
+async def db_session() -> AsyncGenerator[AsyncSession, None]:
+    """A session on the test database, rolled back at the end of the test."""
+    async with TestingSessionLocal() as session:
+        yield session
+        await session.rollback()
+
+@pytest.fixture
+def create_amenities(db_session) -> Callable[..., Awaitable[List[str]]]:
+    """Create amenities with the given names and return their ids, as strings."""
+    async def create(*names: str) -> List[str]:
+        amenities = [Amenity(name=name) for name in names]
+        db_session.add_all(amenities)
+        await db_session.commit()
+        return [str(amenity.id) for amenity in amenities]
+    
+    return create
+
+@pytest.fixture
+def sql_statements():
+    """SQL statements sent to the test database while the test runs."""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
@@ -0,0 +1,129 @@
+import json
+import uuid
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.geo import grid_cell
+from app.services.property_search import SearchFilters, feed_query
+
+# The planner only prefers indexes once the table is big enough, so these tests
+# seed a realistic amount of rows inside a transaction that is rolled back afterwards.
+SEED_ROWS = 50000
+
+
+async def seed_properties(session: AsyncSession):
+    """Insert a landlord and SEED_ROWS properties spread over 50 cities, then ANALYZE."""
+    await session.execute(text("""
+        INSERT INTO users (id, created_at, updated_at, email, hashed_password, is_active,
+                           is_superuser, is_verified, role, is_onboarded)
+        VALUES ('00000000-0000-0000-0000-0000000000aa', now(), now(), 'explain@test.com', 'x',
+                true, false, true, 'landlord', true)
+    """))
+    await session.execute(text(f"""
+        INSERT INTO properties (id, created_at, updated_at, landlord_id, title, description,
+                                price, surface, charges_included, deposit, city, address,
+                                postal_code, latitude, longitude, room_type, furnished,
+                                available_from, min_duration_months, is_active)
+        SELECT gen_random_uuid(), now() - g * interval '1 minute', now(),
+               '00000000-0000-0000-0000-0000000000aa', 'Listing ' || g,
+               (ARRAY['Studio calme', 'Grand balcon plein sud', 'Proche du métro', 'Colocation'])[g % 4 + 1]
+               || ' n°' || g,
+               300 + (g * 37) % 1500, 20, 0, 0, 'City' || (g % 50), g || ' Rue',
+               '75001', 44 + (g * 7) % 600 / 100.0, -1 + (g * 13) % 800 / 100.0,
+               'studio', false, current_date, 1, g % 10 <> 0
+        FROM generate_series(1, {SEED_ROWS}) AS g
+    """))
+    await session.execute(text("ANALYZE properties"))
+
+
+async def explain(session: AsyncSession, query) -> str:
+    """Return the JSON plan of a query, as the endpoint would run it."""
+    connection = await session.connection()
+    compiled = query.compile(dialect=connection.dialect, compile_kwargs={"render_postcompile": True})
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+    return json.dumps(result.scalar())
+
+
+@pytest.mark.asyncio
+async def test_feed_uses_created_at_index(db_session: AsyncSession):
+    """The unfiltered feed walks the (created_at, id) partial index instead of sorting."""
+    await seed_properties(db_session)
+
+    plan = await explain(db_session, feed_query(SearchFilters(), limit=100))
+    assert "ix_properties_active_created_at_id" in plan
+    assert "Seq Scan" not in plan
+
+
+@pytest.mark.asyncio
+async def test_city_feed_uses_city_index(db_session: AsyncSession):
+    """A city filter sorted by recency uses the (city, created_at, id) partial index."""
+    await seed_properties(db_session)
+
+    plan = await explain(db_session, feed_query(SearchFilters(city="City7"), limit=100))
+    assert "ix_properties_active_city_created_at_id" in plan
+    assert "Seq Scan" not in plan
+
+
+@pytest.mark.asyncio
+async def test_city_price_range_uses_city_price_index(db_session: AsyncSession):
+    """A narrow price range within a city is served by the (city, price) partial index."""
+    await seed_properties(db_session)
+
+    plan = await explain(db_session, feed_query(SearchFilters(city="City7", min_price=500, max_price=520), limit=100))
+    assert "ix_properties_active_city_price" in plan
+    assert "Seq Scan" not in plan
+
+
+@pytest.mark.asyncio
+async def test_radius_search_uses_geo_cell_index(db_session: AsyncSession):
+    """A radius search looks up a handful of grid cells instead of scanning coordinates."""
+    await seed_properties(db_session)
+
+    plan = await explain(db_session, feed_query(SearchFilters(near=(46.5, 3.2, 3.0)), limit=100))
+    assert "ix_properties_active_geo_cell" in plan
+    assert "Seq Scan" not in plan
+
+
+@pytest.mark.asyncio
+async def test_geo_cell_matches_python_grid(db_session: AsyncSession):
+    """The generated column and app.core.geo.grid_cell agree on every seeded point."""
+    await seed_properties(db_session)
+
+    result = await db_session.execute(text(
+        "SELECT latitude, longitude, geo_cell FROM properties WHERE latitude IS NOT NULL LIMIT 2000"
+    ))
+    for latitude, longitude, geo_cell in result.all():
+        assert geo_cell == grid_cell(latitude, longitude)
+
+
+@pytest.mark.asyncio
+async def test_keyword_search_uses_gin_index(db_session: AsyncSession):
+    """A keyword search is answered from the GIN index on the search vector."""
+    await seed_properties(db_session)
+    # A selective keyword, as in real searches
+    await db_session.execute(text(
+        "UPDATE properties SET description = description || ' terrasse' WHERE price = 301"
+    ))
+    await db_session.execute(text("ANALYZE properties"))
+
+    plan = await explain(db_session, feed_query(SearchFilters(text_query="terrasse"), limit=100))
+    assert "ix_properties_search_vector" in plan
+    assert "Seq Scan" not in plan
+
+
+@pytest.mark.asyncio
+async def test_amenity_filter_uses_gin_index(db_session: AsyncSession):
+    """Must-have amenities are a single containment predicate on the GIN-indexed array."""
+    await seed_properties(db_session)
+    wifi, washer = uuid.uuid4(), uuid.uuid4()
+    await db_session.execute(
+        text("UPDATE properties SET amenity_ids = ARRAY[CAST(:wifi AS uuid), CAST(:washer AS uuid)] WHERE price < 310"),
+        {"wifi": wifi, "washer": washer},
+    )
+    await db_session.execute(text("ANALYZE properties"))
+
+    plan = await explain(db_session, feed_query(SearchFilters(amenity_ids=(wifi, washer)), limit=100))
+    assert "ix_properties_amenity_ids" in plan
+    assert "Seq Scan" not in plan
@@ -0,0 +1,49 @@
+import uuid
+from collections import Counter
+from datetime import date
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.analytics import record_stats
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+
+@pytest.mark.asyncio
+async def test_record_stats_rows_in_lock_order():
+    """Rows are upserted in (property_id, day) order whatever the order of the changes."""
+    ids = sorted(uuid.uuid4() for _ in range(3))
+    changes = {
+        (ids[2], date(2026, 1, 1)): Counter(likes=1),
+        (ids[0], date(2026, 1, 2)): Counter(passes=1),
+        (ids[1], date(2026, 1, 1)): Counter(matches=1),
+        (ids[0], date(2026, 1, 1)): Counter(rejections=1),
+        # Nothing to add
+        (ids[1], date(2026, 1, 2)): Counter(likes=0),
+    }
+    session = RecordingSession()
+    await record_stats(session, changes)
+
+    params = session.statements[0].compile(dialect=postgresql.dialect()).params
+    keys = [(params[f"property_id_m{i}"], params[f"day_m{i}"]) for i in range(4)]
+    assert keys == [
+        (ids[0], date(2026, 1, 1)),
+        (ids[0], date(2026, 1, 2)),
+        (ids[1], date(2026, 1, 1)),
+        (ids[2], date(2026, 1, 1)),
+    ]
+    assert "property_id_m4" not in params
+
+
+@pytest.mark.asyncio
+async def test_record_stats_without_changes():
+    session = RecordingSession()
+    await record_stats(session, {(uuid.uuid4(), date(2026, 1, 1)): Counter()})
+    assert session.statements == []
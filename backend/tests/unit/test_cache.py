@@ -0,0 +1,71 @@
+import uuid
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.services import property_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_hit_and_miss_counters():
+    cache = TTLCache(maxsize=2, ttl=60)
+    assert cache.get("a") is None
+    cache.set("a", b"1")
+    assert cache.get("a") == b"1"
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 2}
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", b"3")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"
+
+
+def test_entries_expire():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=2, ttl=60, clock=clock)
+    cache.set("a", b"1")
+    clock.now = 59
+    assert cache.get("a") == b"1"
+    clock.now = 60
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_invalidate_and_disabled_cache():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", b"1")
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert cache.get("a") is None
+
+    disabled = TTLCache(maxsize=0, ttl=60)
+    disabled.set("a", b"1")
+    assert disabled.get("a") is None
+
+
+def test_property_generations_are_bounded(monkeypatch):
+    monkeypatch.setattr(settings, "PROPERTY_CACHE_SIZE", 2)
+    monkeypatch.setattr(property_cache, "_invalidated_at", property_cache.OrderedDict())
+    monkeypatch.setattr(property_cache, "_forgotten_generation", property_cache._forgotten_generation)
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    read_first = property_cache.property_generation(first)
+    read_third = property_cache.property_generation(third)
+    property_cache.invalidate_property(first)
+    property_cache.invalidate_property(second)
+    property_cache.invalidate_property(third)
+    assert len(property_cache._invalidated_at) == 2
+    # `first` was dropped, but a read started before its invalidation still sees a change
+    assert property_cache.property_generation(first) != read_first
+    assert property_cache.property_generation(third) != read_third
@@ -0,0 +1,71 @@
+import io
+import json
+import tracemalloc
+from app.services.property_import import detect_format, iter_csv_rows, iter_ndjson_rows
+
+HEADER = b"title,description,price,surface,city,address,postal_code,room_type,available_from,furnished,amenity_ids,image_urls\n"
+
+
+def test_detect_format():
+    assert detect_format("units.CSV", None) == "csv"
+    assert detect_format("units.jsonl", "application/octet-stream") == "ndjson"
+    assert detect_format("upload", "application/x-ndjson; charset=utf-8") == "ndjson"
+    assert detect_format("units.xlsx", "application/vnd.ms-excel") is None
+
+
+def test_csv_rows():
+    data = HEADER + (
+        b"Studio,Nice,700,20,Paris,Rue,75001,studio,2026-03-01,,a|b,https://img/1.jpg\n"
+        b'"Loft, top floor","Two\nlines",900,40,Lyon,Rue,69001,loft,2026-03-01,true,,\n'
+        b"Broken,too,many,values,Paris,Rue,75001,studio,2026-03-01,,,,extra\n"
+    )
+    rows = list(iter_csv_rows(io.BytesIO(b"\xef\xbb\xbf" + data)))
+    assert rows[0] == (2, {
+        "title": "Studio", "description": "Nice", "price": "700", "surface": "20", "city": "Paris",
+        "address": "Rue", "postal_code": "75001", "room_type": "studio", "available_from": "2026-03-01",
+        "amenity_ids": ["a", "b"], "image_urls": ["https://img/1.jpg"],
+    }, None)
+    line, loft, error = rows[1]
+    assert (line, loft["title"], loft["description"], loft["furnished"], error) == (4, "Loft, top floor", "Two\nlines", "true", None)
+    assert "amenity_ids" not in loft
+    assert rows[2] == (5, None, "More values than columns")
+
+
+def test_ndjson_rows():
+    data = b'{"title": "A"}\n\nnot json\n[1, 2]\n'
+    rows = list(iter_ndjson_rows(io.BytesIO(data)))
+    assert rows[0] == (1, {"title": "A"}, None)
+    assert [(line, error.split(":")[0]) for line, _, error in rows[1:]] == [(3, "Invalid JSON"), (4, "Expected a JSON object")]
+
+
+def test_unreadable_lines_are_reported():
+    csv_data = HEADER + (
+        b"Caf\xe9,Latin-1,700,20,Paris,Rue,75001,studio,2026-03-01,,,\n"
+        # Over the csv module's field size limit
+        b"Huge," + b"x" * 200_000 + b",700,20,Paris,Rue,75001,studio,2026-03-01,,,\n"
+        b"Studio,Fine,700,20,Paris,Rue,75001,studio,2026-03-01,,,\n"
+    )
+    rows = list(iter_csv_rows(io.BytesIO(csv_data)))
+    assert [(line, error and error.split(":")[0]) for line, _, error in rows] == [
+        (2, "Not valid UTF-8"), (3, "Invalid CSV"), (4, None)
+    ]
+    assert rows[2][1]["title"] == "Studio"
+
+    ndjson_data = b'{"title": "Caf\xe9"}\n{"title": "Fine"}\n'
+    rows = list(iter_ndjson_rows(io.BytesIO(ndjson_data)))
+    assert rows == [(1, None, "Not valid UTF-8"), (2, {"title": "Fine"}, None)]
+
+
+def test_parsing_memory_is_flat():
+    """Rows are parsed one at a time: peak memory does not grow with the file."""
+    row = json.dumps({"title": "Studio", "description": "x" * 200, "price": 700}).encode() + b"\n"
+    stream = io.BytesIO(row * 20_000)
+
+    tracemalloc.start()
+    count = sum(1 for _ in iter_ndjson_rows(stream))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert count == 20_000
+    # The file itself is ~5 MB
+    assert peak < 1_000_000
@@ -0,0 +1,84 @@
+import time
+import uuid
+import numpy as np
+from datetime import date
+from app.models.profile import StudentProfile
+from app.services.scoring import CandidateColumns, rank_candidates, score_candidates
+
+
+def make_profile(**fields) -> StudentProfile:
+    return StudentProfile(
+        user_id=uuid.uuid4(),
+        first_name="Test",
+        last_name="Student",
+        birth_date=date(2000, 1, 1),
+        **fields
+    )
+
+
+def make_rows(*rows):
+    """(price, city, room_type, furnished) -> rows as selected with SCORING_COLUMNS."""
+    return [(uuid.uuid4(), *row) for row in rows]
+
+
+def test_better_fit_ranks_first():
+    profile = make_profile(city="Paris", budget_min=400, budget_max=800, room_type="studio", furnished=True)
+    rows = make_rows(
+        (1200.0, "Paris", "studio", True),   # over budget
+        (650.0, "Lyon", "studio", True),     # wrong city
+        (700.0, "Paris", "studio", True),    # perfect fit
+        (700.0, "Paris", "T2", False),       # wrong type, unfurnished
+    )
+    ranked = rank_candidates(profile, CandidateColumns.from_rows(rows), limit=4)
+    # Ties (wrong city vs wrong type) keep their original order
+    assert ranked == [rows[2][0], rows[0][0], rows[1][0], rows[3][0]]
+
+
+def test_empty_profile_keeps_original_order():
+    profile = make_profile()
+    rows = make_rows((500.0, "Paris", "studio", True), (900.0, "Lyon", "T2", False))
+    ranked = rank_candidates(profile, CandidateColumns.from_rows(rows), limit=2)
+    assert ranked == [rows[0][0], rows[1][0]]
+
+
+def test_guarantor_income_coverage():
+    profile = make_profile(guarantor_income=2400.0)
+    rows = make_rows((800.0, "Paris", "studio", True), (1600.0, "Paris", "studio", True))
+    scores = score_candidates(profile, CandidateColumns.from_rows(rows))
+    # 3x the rent is fully covered, 1.5x only half
+    assert scores[0] > scores[1]
+
+
+def test_no_candidates():
+    profile = make_profile(city="Paris")
+    assert rank_candidates(profile, CandidateColumns.from_rows([]), limit=10) == []
+
+
+def test_scoring_throughput_benchmark():
+    """Score 100k candidates in one pass; prints the throughput (run with -s)."""
+    rng = np.random.default_rng(0)
+    n = 100_000
+    cities = np.array(["Paris", "Lyon", "Marseille", "Lille", "Nantes"])
+    room_types = np.array(["studio", "T1", "T2", "private_room"])
+    rows = list(zip(
+        [uuid.uuid4() for _ in range(n)],
+        rng.uniform(300, 2000, n).tolist(),
+        cities[rng.integers(0, len(cities), n)].tolist(),
+        room_types[rng.integers(0, len(room_types), n)].tolist(),
+        rng.integers(0, 2, n).astype(bool).tolist(),
+    ))
+    candidates = CandidateColumns.from_rows(rows)
+    profile = make_profile(
+        city="Lyon", budget_min=400, budget_max=800, room_type="studio", furnished=True, guarantor_income=2500.0
+    )
+
+    start = time.perf_counter()
+    rounds = 20
+    for _ in range(rounds):
+        ranked = rank_candidates(profile, candidates, limit=20)
+    elapsed = time.perf_counter() - start
+
+    # Informational only: timings depend on the machine, so no threshold is asserted
+    throughput = n * rounds / elapsed
+    print(f"\nscored {n * rounds:,} candidates in {elapsed:.3f}s ({throughput:,.0f} candidates/s)")
+    assert len(ranked) == 20
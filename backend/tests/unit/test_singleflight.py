@@ -0,0 +1,55 @@
+import asyncio
+import pytest
+from app.core.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_result():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*[flight.do("key", fetch) for _ in range(10)])
+    assert results == [1] * 10
+    assert len(flight) == 0
+
+    # Once completed, the next caller starts a new call
+    assert await flight.do("key", fetch) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(*[flight.do("key", fail) for _ in range(3)], return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_forget_starts_a_new_call():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+        return "old"
+
+    async def fresh():
+        return "new"
+
+    old = asyncio.ensure_future(flight.do("key", slow))
+    await asyncio.sleep(0)
+    flight.forget("key")
+    assert await flight.do("key", fresh) == "new"
+    release.set()
+    assert await old == "old"
+    assert len(flight) == 0